@@ -15,12 +15,16 @@ GTFS files include:
 """
 
 import argparse
+import io
 import json
+import os
+import shutil
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict
 
 import requests
 
@@ -39,52 +43,96 @@ GTFS_FEEDS = {
     }
 }
 
+# Buffer size for copying response/zip streams (1 MiB keeps the copy loop in C)
+COPY_BUFFER_SIZE = 1024 * 1024
 
-def download_gtfs(feed_key: str, output_dir: Path) -> Dict:
+
+def extract_member(zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo, dest_dir: Path) -> None:
+    """Stream one zip member to dest_dir through a 1 MiB copy buffer."""
+    target = (dest_dir / member.filename).resolve()
+    if not target.is_relative_to(dest_dir.resolve()):
+        raise ValueError(f"Unsafe path in GTFS zip: {member.filename}")
+
+    if member.is_dir():
+        target.mkdir(parents=True, exist_ok=True)
+        return
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with zip_ref.open(member) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, length=COPY_BUFFER_SIZE)
+
+
+def download_gtfs(
+    feed_key: str,
+    output_dir: Path,
+    log: Callable[[str], None] = print
+) -> Dict:
     """
     Download and extract a GTFS feed.
 
     Args:
         feed_key: Key for the GTFS feed (e.g., "nyc_ferry", "staten_island")
         output_dir: Directory to save extracted files
+        log: Callable receiving progress messages (default: print)
 
     Returns:
         Dictionary with download metadata
     """
 
     feed_info = GTFS_FEEDS[feed_key]
-    print(f"Downloading {feed_info['name']} GTFS feed...")
-    print(f"  URL: {feed_info['url']}")
-
-    # Download zip file
-    response = requests.get(feed_info['url'], stream=True)
-    response.raise_for_status()
+    log(f"Downloading {feed_info['name']} GTFS feed...")
+    log(f"  URL: {feed_info['url']}")
 
     # Create output directory
     feed_dir = output_dir / feed_key
     feed_dir.mkdir(parents=True, exist_ok=True)
+    metadata_file = feed_dir / "metadata.json"
 
-    # Save zip file temporarily
-    zip_path = feed_dir / "gtfs.zip"
-    with open(zip_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
-
-    print(f"  Downloaded {zip_path.stat().st_size:,} bytes")
-
-    # Extract zip file
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(feed_dir)
+    # Revalidate against the previous download (if its files are still there)
+    # so an unchanged feed costs a 304 instead of a full download
+    prior_metadata = None
+    headers = {}
+    if metadata_file.exists():
+        with open(metadata_file) as f:
+            prior_metadata = json.load(f)
+        if all((feed_dir / filename).exists() for filename in prior_metadata.get('files', [])):
+            if prior_metadata.get('etag'):
+                headers['If-None-Match'] = prior_metadata['etag']
+            if prior_metadata.get('last_modified'):
+                headers['If-Modified-Since'] = prior_metadata['last_modified']
 
-    # List extracted files
-    extracted_files = [f.name for f in feed_dir.iterdir() if f.is_file() and f.name != "gtfs.zip"]
-    print(f"  Extracted {len(extracted_files)} files:")
-    for filename in sorted(extracted_files):
-        file_path = feed_dir / filename
-        print(f"    {filename} ({file_path.stat().st_size:,} bytes)")
+    # Download zip file
+    response = requests.get(feed_info['url'], stream=True, headers=headers)
+    response.raise_for_status()
 
-    # Remove zip file
-    zip_path.unlink()
+    if response.status_code == 304:
+        log(f"  Not modified since {prior_metadata['downloaded_at']}, keeping existing files")
+        return prior_metadata
+
+    # Buffer zip in memory (feeds are <10 MB) so it never touches disk
+    response.raw.decode_content = True
+    buffer = io.BytesIO()
+    shutil.copyfileobj(response.raw, buffer, length=COPY_BUFFER_SIZE)
+
+    log(f"  Downloaded {buffer.getbuffer().nbytes:,} bytes")
+
+    # Extract members in parallel; zlib releases the GIL while inflating,
+    # so the large stop_times.txt no longer serializes the whole extraction
+    with zipfile.ZipFile(buffer, 'r') as zip_ref:
+        members = zip_ref.infolist()
+        with ThreadPoolExecutor(max_workers=min(8, len(members) or 1)) as executor:
+            list(executor.map(lambda member: extract_member(zip_ref, member, feed_dir), members))
+
+    # List extracted files (one scandir pass; DirEntry caches file type)
+    with os.scandir(feed_dir) as it:
+        entries = sorted(
+            (entry for entry in it if entry.is_file() and entry.name != "metadata.json"),
+            key=lambda entry: entry.name
+        )
+    extracted_files = [entry.name for entry in entries]
+    log(f"  Extracted {len(extracted_files)} files:")
+    for entry in entries:
+        log(f"    {entry.name} ({entry.stat().st_size:,} bytes)")
 
     # Create metadata
     metadata = {
@@ -93,15 +141,16 @@ def download_gtfs(feed_key: str, output_dir: Path) -> Dict:
         "source_url": feed_info['url'],
         "downloaded_at": datetime.now().isoformat(),
         "files": extracted_files,
-        "output_dir": str(feed_dir)
+        "output_dir": str(feed_dir),
+        "etag": response.headers.get('ETag'),
+        "last_modified": response.headers.get('Last-Modified')
     }
 
     # Save metadata
-    metadata_file = feed_dir / "metadata.json"
     with open(metadata_file, 'w') as f:
         json.dump(metadata, f, indent=2)
 
-    print(f"  Saved metadata to {metadata_file}")
+    log(f"  Saved metadata to {metadata_file}")
 
     return metadata
 
@@ -150,18 +199,28 @@ Examples:
         else:
             feeds_to_download = list(GTFS_FEEDS.keys())
 
-        # Download each feed
+        # Download feeds concurrently (I/O-bound, so threads suffice).
+        # Each feed logs into its own buffer so output doesn't interleave.
         all_metadata = {}
-        for feed_key in feeds_to_download:
-            print(f"\n{'='*60}")
-            metadata = download_gtfs(feed_key, args.output)
-            all_metadata[feed_key] = metadata
+        with ThreadPoolExecutor(max_workers=len(feeds_to_download)) as executor:
+            futures = {}
+            for feed_key in feeds_to_download:
+                feed_log = []
+                future = executor.submit(download_gtfs, feed_key, args.output, feed_log.append)
+                futures[future] = (feed_key, feed_log)
+
+            for future in as_completed(futures):
+                feed_key, feed_log = futures[future]
+                print(f"\n{'='*60}")
+                print("\n".join(feed_log))
+                all_metadata[feed_key] = future.result()
 
         # Print summary
         print(f"\n{'='*60}")
         print("Download complete!")
         print(f"\nSummary:")
-        for feed_key, metadata in all_metadata.items():
+        for feed_key in feeds_to_download:
+            metadata = all_metadata[feed_key]
             print(f"  {metadata['feed']}:")
             print(f"    Files: {len(metadata['files'])}")
             print(f"    Location: {metadata['output_dir']}")
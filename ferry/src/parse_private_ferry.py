@@ -22,13 +22,31 @@ Usage:
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from datetime import datetime
+from datetime import date
+from types import MappingProxyType
 import re
-from openpyxl import load_workbook
+from python_calamine import CalamineWorkbook
 import sys
 import argparse
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterable
+
+# Holiday annotations like "(New Year's Day) Monday"
+HOLIDAY_RE = re.compile(r'\(([^)]+)\)\s*(\w+)')
+
+# Year/month in filenames like "..._2024_01.xlsx"
+FILE_DATE_RE = re.compile(r'(\d{4})_(\d{2})')
+
+# Date-like strings such as "1/15/2024" or "2024-01-15"
+DATE_LIKE_RE = re.compile(r'\d{1,4}[-/]\d{1,2}[-/]\d{1,4}')
 
 
 def extract_holiday(day_str: str) -> Tuple[str, Optional[str]]:
@@ -42,50 +60,85 @@ def extract_holiday(day_str: str) -> Tuple[str, Optional[str]]:
     day_str = day_str.strip()
 
     # Match patterns like "(New Year's Day) Monday"
-    match = re.match(r'\(([^)]+)\)\s*(\w+)', day_str)
+    match = HOLIDAY_RE.match(day_str)
     if match:
         return (match.group(2).strip(), match.group(1).strip())
 
     return (day_str, None)
 
 
-def is_date_value(val) -> bool:
-    """Check if a value looks like a date."""
-    if isinstance(val, datetime):
-        return True
-    if val is None:
-        return False
+def parse_date_cell(val) -> pd.Timestamp:
+    """Parse one non-datetime date cell on its own; NaT if it doesn't parse."""
     try:
-        pd.to_datetime(val)
+        return pd.to_datetime(val)
+    except (ValueError, TypeError, OverflowError):
+        return pd.NaT
+
+
+def is_date_value(val) -> bool:
+    """Check if a value looks like a date (cheap type checks, no parsing)."""
+    if isinstance(val, (date, np.datetime64)):
         return True
-    except:
+    if val is None or isinstance(val, bool):
         return False
+    if isinstance(val, (int, float)):
+        # Excel serial dates from 1954 to 2119
+        return 20000 < val < 80000
+    if isinstance(val, str):
+        return bool(DATE_LIKE_RE.match(val.strip()))
+    return False
+
 
+# Rows at the top of a sheet scanned for header structure
+HEADER_SCAN_ROWS = 12
 
-def find_header_and_data_rows(ws) -> Tuple[int, int, int]:
+# Day-column labels of summary rows below the daily data (matched lowercase)
+SUMMARY_ROW_PATTERN = 'total|average|weekday ridership|number of'
+
+
+def find_header_and_data_rows(rows: Iterable[tuple]) -> Tuple[int, int, int, List[tuple]]:
     """
-    Find the header rows and data start row by scanning the sheet.
+    Find the header rows and data start row by scanning the top of a sheet.
 
-    Returns: (route_row, stop_row, data_start_row)
+    Rows are consumed lazily, at most HEADER_SCAN_ROWS of them, and the scan
+    stops as soon as the structure is known (3 rows for modern files).
+
+    Args:
+        rows: Rows of the sheet (cell values)
+
+    Returns: (route_row, stop_row, data_start_row, rows_read)
 
     Handles two structure types:
     1. Modern (2024+): Row 0 = title + routes, Row 1 = Day/Date + stops, Row 2+ = data
     2. Legacy (2013-2019): Row 0 = Day/Date + routes, Row 2 = stops, Row 4+ = data
     """
-    rows_data = list(ws.iter_rows(max_row=12, values_only=True))
+
+    rows_iter = islice(rows, HEADER_SCAN_ROWS)
+    rows_data = []
+
+    def row_at(i):
+        # Read further into the sheet only when a row is first needed
+        while len(rows_data) <= i:
+            row = next(rows_iter, None)
+            if row is None:
+                return None
+            rows_data.append(row)
+        return rows_data[i]
 
     day_date_row = None
     route_row = None
     stop_row = None
 
     # Step 1: Find the row with "Day" and/or "Date" in columns 0-1
-    for i, row in enumerate(rows_data):
+    i = 0
+    while (row := row_at(i)) is not None:
         col0 = str(row[0]).strip().lower() if row[0] else ''
         col1 = str(row[1]).strip().lower() if len(row) > 1 and row[1] else ''
 
         if col0 == 'day' or col1 == 'date':
             day_date_row = i
             break
+        i += 1
 
     if day_date_row is None:
         # Fallback
@@ -94,10 +147,8 @@ def find_header_and_data_rows(ws) -> Tuple[int, int, int]:
     # Step 2: Determine structure by checking the row AFTER day_date_row
     # - Modern (2024+): Next row is DATA (has date in col 1)
     # - Legacy (2013-2019): Next row is empty, then stops, then data
-    next_row_is_data = False
-    if day_date_row + 1 < len(rows_data):
-        next_row = rows_data[day_date_row + 1]
-        next_row_is_data = len(next_row) > 1 and is_date_value(next_row[1])
+    next_row = row_at(day_date_row + 1)
+    next_row_is_data = next_row is not None and len(next_row) > 1 and is_date_value(next_row[1])
 
     if next_row_is_data:
         # Modern structure: Day/Date row has stops, previous row has routes
@@ -137,25 +188,32 @@ def find_header_and_data_rows(ws) -> Tuple[int, int, int]:
     # Step 3: Find data start (first row after stop_row where col 1 is a date)
     # Legacy files can have many empty rows between headers and data
     data_start = stop_row + 1
-    for i in range(stop_row + 1, min(len(rows_data), stop_row + 10)):
-        row = rows_data[i]
+    for i in range(stop_row + 1, stop_row + 10):
+        row = row_at(i)
+        if row is None:
+            break
         if len(row) > 1 and is_date_value(row[1]):
             data_start = i
             break
 
-    return (route_row, stop_row, data_start)
+    return (route_row, stop_row, data_start, rows_data)
+
 
+# Route header values treated as blank when forward-filling (matched lowercase)
+ROUTE_HEADER_SKIP = frozenset({'weekday', 'weekdays', 'total', 'none', 'nan', ''})
 
-def forward_fill_header(header_row: list, skip_patterns: List[str] = None) -> list:
+# Stop header values that mark non-data columns (matched lowercase)
+STOP_HEADER_SKIP = frozenset({'day', 'date', 'weekday', 'weekdays', 'none', ''})
+
+
+def forward_fill_header(header_row: list, skip_patterns: frozenset = ROUTE_HEADER_SKIP) -> list:
     """
     Forward-fill None values in a header row (handles merged cells).
 
     Args:
         header_row: List of header values
-        skip_patterns: Patterns to treat as None (e.g., ['Weekday', 'Total'])
+        skip_patterns: Lowercase values to treat as None (e.g., {'weekday', 'total'})
     """
-    if skip_patterns is None:
-        skip_patterns = ['weekday', 'weekdays', 'total', 'none', 'nan', '']
 
     result = []
     last_value = None
@@ -171,27 +229,76 @@ def forward_fill_header(header_row: list, skip_patterns: List[str] = None) -> li
     return result
 
 
-def parse_operator_sheet(wb, sheet_name: str, operator_name: str = None) -> pd.DataFrame:
+def ridership_from_number(value) -> int:
+    """Ridership from a numeric cell (NaN -> 0)."""
+    # NaN is the only value not equal to itself
+    return 0 if value != value else int(value)
+
+
+def ridership_from_str(value: str) -> int:
+    """Ridership from a text cell such as "1,234" (blank/unparseable -> 0)."""
+    value = value.strip()
+    if not value:
+        return 0
+    try:
+        return int(float(value.replace(',', '')))
+    except ValueError:
+        return 0
+
+
+# Exact-type dispatch for the common cell types (skips the isinstance chain)
+RIDERSHIP_PARSERS = {
+    int: int,
+    float: ridership_from_number,
+    str: ridership_from_str,
+    type(None): lambda value: 0,
+}
+
+
+def parse_ridership(value) -> int:
+    """Convert one raw cell value to integer ridership (blank/unparseable -> 0)."""
+    parser = RIDERSHIP_PARSERS.get(type(value))
+    if parser is not None:
+        return parser(value)
+
+    # Subclasses and other types (bool, numpy scalars, ...)
+    if isinstance(value, (int, float)):
+        return ridership_from_number(value)
+    try:
+        return int(float(str(value).replace(',', '')))
+    except (TypeError, ValueError):
+        return 0
+
+
+def coerce_ridership(values: np.ndarray) -> np.ndarray:
+    """Vectorized parse_ridership over an object array of cell values."""
+    numeric = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=np.float64, copy=True)
+
+    # Cells to_numeric couldn't read (e.g. "1,234") take the scalar path
+    fallback = np.flatnonzero(np.isnan(numeric) & pd.notna(values))
+    numeric[fallback] = [parse_ridership(values[i]) for i in fallback]
+
+    return np.nan_to_num(numeric, nan=0).astype(np.int32)
+
+
+def parse_operator_sheet(sheets: Dict[str, List[list]], sheet_name: str, operator_name: str = None) -> pd.DataFrame:
     """
     Parse a single operator sheet with auto-detected headers.
 
     Returns DataFrame with columns:
         date, day_of_week, holiday, operator, destination, origin, ridership
     """
-    ws = wb[sheet_name]
+    rows = sheets[sheet_name]
 
-    # Find header structure
-    route_row_idx, stop_row_idx, data_start_idx = find_header_and_data_rows(ws)
+    # Find header structure (only the rows needed to identify it are read)
+    route_row_idx, stop_row_idx, data_start_idx, head = find_header_and_data_rows(rows)
 
-    # Read header rows
-    all_rows = list(ws.iter_rows(values_only=True))
-
-    if route_row_idx >= len(all_rows) or stop_row_idx >= len(all_rows):
+    if route_row_idx >= len(head) or stop_row_idx >= len(head):
         print(f"    Warning: Could not find headers in {sheet_name}")
         return pd.DataFrame()
 
-    route_row = list(all_rows[route_row_idx])
-    stop_row = list(all_rows[stop_row_idx])
+    route_row = list(head[route_row_idx])
+    stop_row = list(head[stop_row_idx])
 
     # Forward-fill routes (handles merged cells)
     routes_filled = forward_fill_header(route_row)
@@ -203,7 +310,7 @@ def parse_operator_sheet(wb, sheet_name: str, operator_name: str = None) -> pd.D
             stops.append(None)
         else:
             s = str(val).strip()
-            if s.lower() in ['day', 'date', 'weekday', 'weekdays', 'none', '']:
+            if s.lower() in STOP_HEADER_SKIP:
                 stops.append(None)
             else:
                 stops.append(s)
@@ -235,85 +342,61 @@ def parse_operator_sheet(wb, sheet_name: str, operator_name: str = None) -> pd.D
             'origin': stop                       # Origin/stop (NJ departure or boarding stop)
         })
 
-    # Parse data rows
-    records = []
-
-    for row_idx in range(data_start_idx, len(all_rows)):
-        row = all_rows[row_idx]
-
-        if not row or len(row) < 2:
-            continue
-
-        day_val = row[0]
-        date_val = row[1]
-
-        # Skip empty rows
-        if day_val is None and date_val is None:
-            continue
-
-        # Skip summary rows
-        if day_val and isinstance(day_val, str):
-            day_lower = day_val.lower()
-            if any(skip in day_lower for skip in ['total', 'average', 'weekday ridership', 'number of']):
-                continue
-
-        # Parse date
-        if isinstance(date_val, datetime):
-            date_parsed = date_val.date()
-        elif date_val:
-            try:
-                date_parsed = pd.to_datetime(date_val).date()
-            except:
-                continue  # Skip rows without valid dates
-        else:
-            continue
-
-        # Extract holiday
-        clean_day, holiday = extract_holiday(str(day_val) if day_val else '')
-
-        # Extract ridership for each column
-        for col_meta in columns_meta:
-            col_idx = col_meta['col_idx']
-            if col_idx >= len(row):
-                continue
-
-            value = row[col_idx]
-
-            # Convert to integer ridership
-            if value is None or value == '' or (isinstance(value, str) and value.strip() == ''):
-                ridership = 0
-            elif isinstance(value, (int, float)):
-                ridership = int(value) if not pd.isna(value) else 0
-            else:
-                try:
-                    ridership = int(float(str(value).replace(',', '')))
-                except:
-                    ridership = 0
-
-            records.append({
-                'date': date_parsed,
-                'day_of_week': clean_day,
-                'holiday': holiday,
-                'operator': operator_name or sheet_name,
-                'destination': col_meta['destination'],
-                'origin': col_meta['origin'],
-                'ridership': ridership
-            })
-
-    return pd.DataFrame(records)
-
+    # Data rows as one frame: column 0 = Day, column 1 = Date, then route columns
+    data = pd.DataFrame(rows[data_start_idx:], dtype=object)
+    if data.shape[1] < 2 or not columns_meta:
+        return pd.DataFrame()
 
-def parse_monthly_totals(wb) -> Dict[str, Any]:
+    day_vals = data[0]
+    date_vals = data[1]
+
+    # Skip summary rows, and rows without a valid date (blank cells never parse)
+    # (Day cells can be numbers or dates on some sheets; only strings can be summaries)
+    is_summary = day_vals.map(
+        lambda v: isinstance(v, str) and re.search(SUMMARY_ROW_PATTERN, v.lower()) is not None
+    ).astype(bool)
+    # Real datetime/date cells convert in one vectorized call; string cells are
+    # parsed one by one since their format can vary within a sheet
+    is_datetime = date_vals.map(lambda v: isinstance(v, (date, np.datetime64)))
+    parsed_dates = pd.to_datetime(date_vals.where(is_datetime), errors='coerce')
+    is_other = ~is_datetime & date_vals.map(bool)
+    if is_other.any():
+        parsed_dates[is_other] = [parse_date_cell(v) for v in date_vals[is_other]]
+    keep = (~is_summary & parsed_dates.notna()).to_numpy()
+
+    # Extract holiday
+    day_holiday = [extract_holiday(str(v) if v else '') for v in day_vals[keep]]
+    days = [clean_day for clean_day, _ in day_holiday]
+    holidays = [holiday for _, holiday in day_holiday]
+    dates = parsed_dates[keep].dt.date.to_numpy(dtype=object)
+
+    # Ridership block (data rows x route columns), coerced in one shot
+    col_indices = [col_meta['col_idx'] for col_meta in columns_meta]
+    n_rows, n_cols = len(dates), len(col_indices)
+    block = data.loc[keep, col_indices].to_numpy(dtype=object)
+    ridership = coerce_ridership(block.ravel())
+
+    # Long format: one record per (row, column)
+    return pd.DataFrame({
+        'date': np.repeat(dates, n_cols),
+        'day_of_week': np.repeat(np.array(days, dtype=object), n_cols),
+        'holiday': np.repeat(np.array(holidays, dtype=object), n_cols),
+        'operator': operator_name or sheet_name,
+        'destination': np.tile(np.array([m['destination'] for m in columns_meta], dtype=object), n_rows),
+        'origin': np.tile(np.array([m['origin'] for m in columns_meta], dtype=object), n_rows),
+        'ridership': ridership
+    })
+
+
+def parse_monthly_totals(sheets: Dict[str, List[list]]) -> Dict[str, Any]:
     """Parse the Monthly Totals sheet for validation."""
-    if 'Monthly Totals' not in wb.sheetnames:
+    if 'Monthly Totals' not in sheets:
         return {}
 
-    ws = wb['Monthly Totals']
-
     summary = {'by_operator': {}}
     section = None
 
-    for row in ws.iter_rows(values_only=True):
+    for row in sheets['Monthly Totals']:
         if not row or not any(row):
             continue
 
@@ -330,7 +413,9 @@ def parse_monthly_totals(wb) -> Dict[str, Any]:
                 section = 'operator'
                 break
             elif 'Ridership by' in cell_str:
-                section = None  # End of operator section
+                if section == 'operator':
+                    return summary  # End of operator section; nothing else is used
+                section = None
                 break
             elif section == 'operator' and cell_str and cell_str != 'Total':
                 if isinstance(cell, (int, float)) and not pd.isna(cell):
@@ -345,7 +430,7 @@ def parse_monthly_totals(wb) -> Dict[str, Any]:
 
 
 # Operator name mappings (normalize across years)
-OPERATOR_MAPPINGS = {
+OPERATOR_MAPPINGS = MappingProxyType({
     # 2024 names
     'NYC Ferry': 'NYC Ferry',
     'NYWW (Port Imperial FC)': 'NY Waterway',
@@ -361,12 +446,38 @@ OPERATOR_MAPPINGS = {
     'New York Water Tours': 'Water Tours',
     'Baseball': 'Baseball',
     'HMS': 'HMS',
-}
+})
+
+# Same mappings keyed by stripped, lowercased name (sheet names vary in case across years)
+OPERATOR_MAPPINGS_LC = MappingProxyType({k.strip().lower(): v for k, v in OPERATOR_MAPPINGS.items()})
+
+
+def normalize_operator(name: str) -> str:
+    """Map a sheet or summary operator name to its normalized operator name."""
+    name = name.strip()
+    return OPERATOR_MAPPINGS_LC.get(name.lower(), name)
+
+# Output columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ['operator', 'destination', 'origin', 'day_of_week', 'holiday']
 
 # Sheets to skip
 SKIP_SHEETS = {'Monthly Totals', 'Weekday Totals', 'Sheet1', 'Sheet2'}
 
 
+def load_sheets(filepath: Path) -> Dict[str, List[list]]:
+    """
+    Read cell values for the operator sheets and Monthly Totals with calamine.
+
+    Returns {sheet_name: rows}, in workbook order. Empty cells come back as ''.
+    """
+    wb = CalamineWorkbook.from_path(str(filepath))
+    return {
+        name: wb.get_sheet_by_name(name).to_python(skip_empty_area=False)
+        for name in wb.sheet_names
+        if name == 'Monthly Totals' or name not in SKIP_SHEETS
+    }
+
+
 def parse_private_ferry_excel(filepath, verbose: bool = True) -> Dict[str, Any]:
     """
     Parse a complete private ferry ridership Excel file.
@@ -378,23 +489,23 @@ def parse_private_ferry_excel(filepath, verbose: bool = True) -> Dict[str, Any]:
         - 'file_info': Metadata
     """
     filepath = Path(filepath)
-    wb = load_workbook(filepath, data_only=True)
+    sheets = load_sheets(filepath)
 
     all_data = []
     operators_found = []
 
-    for sheet_name in wb.sheetnames:
+    for sheet_name in sheets:
         if sheet_name in SKIP_SHEETS:
             continue
 
-        operator = OPERATOR_MAPPINGS.get(sheet_name, sheet_name)
+        operator = normalize_operator(sheet_name)
         operators_found.append(operator)
 
         if verbose:
             print(f"  Parsing: {sheet_name} -> {operator}")
 
         try:
-            df = parse_operator_sheet(wb, sheet_name, operator)
+            df = parse_operator_sheet(sheets, sheet_name, operator)
             if len(df) > 0:
                 all_data.append(df)
                 if verbose:
@@ -409,14 +520,21 @@ def parse_private_ferry_excel(filepath, verbose: bool = True) -> Dict[str, Any]:
     # Combine all data
     combined = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
 
+    # Low-cardinality labels as categoricals (int codes instead of repeated strings)
+    for col in CATEGORICAL_COLUMNS:
+        if col in combined:
+            combined[col] = combined[col].astype('category')
+
     # Parse summary
     try:
-        summary = parse_monthly_totals(wb)
-    except:
+        summary = parse_monthly_totals(sheets)
+    except (KeyError, ValueError) as e:
+        if verbose:
+            print(f"  Monthly Totals: could not parse ({e})")
         summary = {}
 
     # Extract file metadata
-    match = re.search(r'(\d{4})_(\d{2})', filepath.stem)
+    match = FILE_DATE_RE.search(filepath.stem)
     file_year = int(match.group(1)) if match else None
     file_month = int(match.group(2)) if match else None
 
@@ -446,11 +564,11 @@ def validate_against_summary(result: Dict[str, Any]) -> Dict[str, Any]:
     validation = {'status': 'passed', 'checks': [], 'warnings': []}
 
     # Aggregate by operator
-    parsed_totals = data.groupby('operator')['ridership'].sum().to_dict()
+    parsed_totals = data.groupby('operator', observed=True)['ridership'].sum().to_dict()
 
     for summary_op, expected in summary.get('by_operator', {}).items():
         # Map summary operator name to our normalized name
-        op_normalized = OPERATOR_MAPPINGS.get(summary_op.strip(), summary_op.strip())
+        op_normalized = normalize_operator(summary_op)
         actual = parsed_totals.get(op_normalized, 0)
 
         if expected == 0:
@@ -473,67 +591,139 @@ def validate_against_summary(result: Dict[str, Any]) -> Dict[str, Any]:
     return validation
 
 
-def process_all_files(input_dir: Path, output_dir: Path, verbose: bool = True) -> pd.DataFrame:
-    """Process all Excel files in a directory."""
-    input_dir = Path(input_dir)
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    all_results = []
-    errors = []
+# Schema of the combined daily parquet (fixed so every file's table matches)
+PARQUET_SCHEMA = pa.schema([
+    ('date', pa.date32()),
+    ('day_of_week', pa.string()),
+    ('holiday', pa.string()),
+    ('operator', pa.string()),
+    ('destination', pa.string()),
+    ('origin', pa.string()),
+    ('ridership', pa.int32()),
+])
 
-    files = sorted(input_dir.glob("*Ridership*.xlsx"))
-    files = [f for f in files if 'summary' not in f.name.lower() and 'CY' not in f.name and 'CalendarYear' not in f.name]
 
-    print(f"Processing {len(files)} files...")
+def parse_file_logged(filepath: Path, verbose: bool = True) -> Tuple[Dict[str, Any], str]:
+    """Run parse_private_ferry_excel in a worker process, returning (result, captured output)."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = parse_private_ferry_excel(filepath, verbose=verbose)
+    return result, log.getvalue()
 
-    for filepath in files:
-        print(f"\n{'='*60}")
-        print(f"File: {filepath.name}")
 
-        try:
-            result = parse_private_ferry_excel(filepath, verbose=verbose)
+def process_all_files(input_dir: Path, output_dir: Path, verbose: bool = True) -> Optional[Path]:
+    """
+    Process all Excel files in a directory.
 
-            if len(result['data']) > 0:
-                all_results.append(result['data'])
+    Each file's rows are appended to the combined parquet as soon as the file
+    is parsed, so only one file's data is held in memory at a time.
 
-                # Validate
-                validation = validate_against_summary(result)
-                if validation['status'] == 'warning':
-                    print(f"  VALIDATION WARNINGS:")
-                    for w in validation['warnings']:
-                        print(f"    - {w}")
+    Parsed rows are also cached per file under output_dir/by_file/; files
+    whose cache is newer than the Excel file are loaded from it instead of
+    being parsed again.
 
-                print(f"  -> {result['file_info']['total_records']:,} records, {result['file_info']['total_ridership']:,} ridership")
-            else:
-                print(f"  -> No data extracted")
-                errors.append((filepath.name, "No data"))
+    Returns the combined parquet path, or None if no data was extracted.
+    """
+    input_dir = Path(input_dir)
+    output_dir = Path(output_dir)
+    cache_dir = output_dir / "by_file"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    output_path = output_dir / "private_ferry_daily.parquet"
+    writer = None
+    total_records = 0
+    total_ridership = 0
+    date_min = None
+    date_max = None
+    errors = []
 
-        except Exception as e:
-            print(f"  -> ERROR: {e}")
-            errors.append((filepath.name, str(e)))
+    files = sorted(input_dir.glob("*Ridership*.xlsx"))
+    files = [f for f in files if 'summary' not in f.name.lower() and 'CY' not in f.name and 'CalendarYear' not in f.name]
 
-    # Combine all results
-    if all_results:
-        combined = pd.concat(all_results, ignore_index=True)
+    # Files parsed on an earlier run and unchanged since
+    cached = {}
+    for filepath in files:
+        cache_path = cache_dir / f"{filepath.stem}.parquet"
+        if cache_path.exists() and cache_path.stat().st_mtime > filepath.stat().st_mtime:
+            cached[filepath] = cache_path
 
-        # Save combined output
-        output_path = output_dir / "private_ferry_daily.parquet"
-        combined.to_parquet(output_path, index=False)
-        print(f"\n{'='*60}")
-        print(f"SAVED: {output_path}")
-        print(f"Total records: {len(combined):,}")
-        print(f"Total ridership: {combined['ridership'].sum():,}")
-        print(f"Date range: {combined['date'].min()} to {combined['date'].max()}")
+    print(f"Processing {len(files)} files ({len(cached)} unchanged, loaded from cache)...")
 
-        if errors:
-            print(f"\nErrors ({len(errors)}):")
-            for fname, err in errors:
-                print(f"  - {fname}: {err}")
+    # Files are independent and parsing is CPU-bound, so fan out across processes.
+    # Results are reported in file order while later files keep parsing.
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                filepath: executor.submit(parse_file_logged, filepath, verbose)
+                for filepath in files if filepath not in cached
+            }
 
-        return combined
+            for filepath in files:
+                print(f"\n{'='*60}")
+                print(f"File: {filepath.name}")
 
-    return pd.DataFrame()
+                try:
+                    if filepath in cached:
+                        table = pq.read_table(cached[filepath], schema=PARQUET_SCHEMA)
+                        print(f"  Loaded from cache: {cached[filepath].name}")
+                    else:
+                        # pop() drops the Future, so this file's rows can be freed
+                        # once written instead of living until the pool exits
+                        result, log = futures.pop(filepath).result()
+                        print(log, end='')
+
+                        if len(result['data']) == 0:
+                            print(f"  -> No data extracted")
+                            errors.append((filepath.name, "No data"))
+                            continue
+
+                        table = pa.Table.from_pandas(result['data'], schema=PARQUET_SCHEMA, preserve_index=False)
+                        pq.write_table(table, cache_dir / f"{filepath.stem}.parquet", compression='zstd')
+
+                        # Validate
+                        validation = validate_against_summary(result)
+                        if validation['status'] == 'warning':
+                            print(f"  VALIDATION WARNINGS:")
+                            for w in validation['warnings']:
+                                print(f"    - {w}")
+
+                    if writer is None:
+                        writer = pq.ParquetWriter(output_path, PARQUET_SCHEMA, compression='zstd')
+                    writer.write_table(table)
+
+                    dates = pc.min_max(table['date'])
+                    file_min = pd.Timestamp(dates['min'].as_py())
+                    file_max = pd.Timestamp(dates['max'].as_py())
+                    date_min = file_min if date_min is None else min(date_min, file_min)
+                    date_max = file_max if date_max is None else max(date_max, file_max)
+                    file_ridership = pc.sum(table['ridership']).as_py() or 0
+                    total_records += table.num_rows
+                    total_ridership += file_ridership
+
+                    print(f"  -> {table.num_rows:,} records, {file_ridership:,} ridership")
+
+                except Exception as e:
+                    print(f"  -> ERROR: {e}")
+                    errors.append((filepath.name, str(e)))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        return None
+
+    print(f"\n{'='*60}")
+    print(f"SAVED: {output_path}")
+    print(f"Total records: {total_records:,}")
+    print(f"Total ridership: {total_ridership:,}")
+    print(f"Date range: {date_min} to {date_max}")
+
+    if errors:
+        print(f"\nErrors ({len(errors)}):")
+        for fname, err in errors:
+            print(f"  - {fname}: {err}")
+
+    return output_path
 
 
 def main():
@@ -567,7 +757,7 @@ def main():
 
         # Ridership by operator
         print(f"\nBy operator:")
-        print(result['data'].groupby('operator')['ridership'].sum().sort_values(ascending=False).to_string())
+        print(result['data'].groupby('operator', observed=True)['ridership'].sum().sort_values(ascending=False).to_string())
 
         # Save if requested
         if args.output:
@@ -6,10 +6,19 @@ Comprehensive analysis of building permits, home values, and rents
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved to files; no GUI backend needed
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
 import seaborn as sns
+import os
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import re
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -21,6 +30,10 @@ BASE_DIR = Path(__file__).parent.parent  # nj-housing-data/
 ANALYSIS_DIR = BASE_DIR / 'analysis'
 TABLES_DIR = ANALYSIS_DIR / 'tables'
 CHARTS_DIR = ANALYSIS_DIR / 'charts'
+CACHE_DIR = BASE_DIR / '.cache'  # Parsed source data (Parquet), rebuilt when sources change
+
+# Chart resolution (set CHART_DPI lower for quick intermediate runs)
+CHART_DPI = int(os.environ.get('CHART_DPI', 150))
 
 # State FIPS codes
 STATE_FIPS = {'NJ': '34', 'NY': '36', 'TX': '48', 'MN': '27', 'CA': '06'}
@@ -41,6 +54,12 @@ CITY_POP = {
     'New York City': 8336817
 }
 
+# Population lookups as arrays indexed by categorical code
+STATE_CAT = pd.CategoricalDtype(list(STATE_POP))
+STATE_POP_ARR = np.array([STATE_POP[s] for s in STATE_CAT.categories], dtype=np.int32)
+CITY_CAT = pd.CategoricalDtype(list(CITY_POP))
+CITY_POP_ARR = np.array([CITY_POP[c] for c in CITY_CAT.categories], dtype=np.int32)
+
 # NJ City 6-digit IDs in Census place data
 NJ_CITY_IDS = {
     '246000': 'Jersey City',
@@ -71,204 +90,229 @@ ZILLOW_CITY_IDS = {
     6181: 'New York'
 }
 
+# Minneapolis 2040 Plan periods (plan adopted late 2018)
+MPLS_PRE_2040 = 'Pre-2040 (2010-2018)'
+MPLS_POST_2040 = 'Post-2040 (2019-2024)'
+
+
+# Units columns of each structure type in the Census BPS files
+UNIT_COLUMNS = ['units_1', 'units_2', 'units_3_4', 'units_5plus']
+
+
+def lookup_population(values, dtype, populations):
+    """Population for each key, gathered by categorical code (NaN for unknown keys)"""
+    codes = pd.Categorical(values, dtype=dtype).codes
+    pop = populations[codes]
+    if (codes < 0).any():
+        pop = np.where(codes >= 0, pop, np.nan)
+    return pop
+
+
+def cached_parquet(name, source_paths, build_fn):
+    """
+    Return the DataFrame built by build_fn, cached as CACHE_DIR/<name>.parquet.
+
+    The cache is reused while it is newer than every source file and this
+    script (so changes to the parsing code or region lists rebuild it).
+    """
+    cache_path = CACHE_DIR / f'{name}.parquet'
+    src_mtime = max(p.stat().st_mtime for p in [Path(__file__), *source_paths])
+    if cache_path.exists() and cache_path.stat().st_mtime >= src_mtime:
+        return pd.read_parquet(cache_path)
+
+    df = build_fn()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so analyses running in parallel processes never see
+    # (or interleave writes into) a half-written cache file
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    df.to_parquet(tmp_path, compression='zstd', index=False)
+    os.replace(tmp_path, cache_path)
+    return df
+
+
+def add_permit_totals(df):
+    """Clean the units columns and add total/structure-type aggregates in place"""
+    # Unit counts fit in int32 and years in int16; narrow dtypes halve the
+    # bytes every later groupby/pivot touches
+    df['year'] = df['year'].astype('int16')
+    df[UNIT_COLUMNS] = df[UNIT_COLUMNS].fillna(0).astype('int32')
+    df['total_units'] = df[UNIT_COLUMNS].sum(axis=1).astype('int32')
+    df['single_family'] = df['units_1']
+    df['small_multi'] = df['units_2'] + df['units_3_4']
+    df['large_multi'] = df['units_5plus']
+    return df
+
+
+# Census BPS file layouts: (column positions, column names) kept from each row
+# State files: 1=FIPS state code, 4=state name
+#              6=1-unit units, 9=2-unit units, 12=3-4 unit units, 15=5+ unit units
+#              (each preceded by buildings and followed by value)
+# Place files: 1=state code, 2=6-digit ID, 16=place name
+#              18=1-unit units, 21=2-unit units, 24=3-4 unit units, 27=5+ unit units
+BPS_COLUMNS = {
+    'state': ([1, 4, 6, 9, 12, 15], ['state_fips', 'state_name'] + UNIT_COLUMNS),
+    'place': ([1, 2, 16, 18, 21, 24, 27], ['state_code', 'six_digit_id', 'place_name'] + UNIT_COLUMNS),
+}
+
+
+def load_bps(prefix, layout):
+    """Read every year's Census BPS file present for a prefix (st/ne/so/mw/we) into one DataFrame"""
+    usecols, names = BPS_COLUMNS[layout]
+    text_cols = [name for name in names if name not in UNIT_COLUMNS]
+
+    def read_year(year, filepath):
+        # Skip header rows (first 3 lines); the file is memory-mapped and
+        # tokenized in bulk by the C parser
+        df = pd.read_csv(filepath, skiprows=3, header=None, usecols=usecols, names=names,
+                         dtype=dict.fromkeys(text_cols, str), on_bad_lines='skip', engine='c',
+                         memory_map=True)
+        df.insert(0, 'year', year)
+        return df
 
+    # One directory scan finds the years actually present (e.g. st2010a.txt)
+    paths = sorted((BASE_DIR / 'census-bps').glob(f'{prefix}[0-9][0-9][0-9][0-9]a.txt'))
+    tasks = [(int(filepath.stem[len(prefix):-1]), filepath) for filepath in paths]
+
+    def build():
+        # Files are independent and the C parser releases the GIL, so read them in parallel
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            frames = list(executor.map(lambda task: read_year(*task), tasks))
+
+        if not frames:
+            return pd.DataFrame(columns=['year'] + names)
+
+        df = pd.concat(frames, ignore_index=True)
+        for col in text_cols:
+            df[col] = df[col].str.strip()
+        return df
+
+    return cached_parquet(f'bps_{prefix}', [filepath for _, filepath in tasks], build)
+
+
+@lru_cache(maxsize=1)
 def load_census_state_data():
     """Load and parse Census state-level building permits data"""
-    all_data = []
-
-    for year in range(2010, 2025):
-        filepath = BASE_DIR / 'census-bps' / f'st{year}a.txt'
-        if not filepath.exists():
-            continue
-
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-
-        # Skip header rows (first 3 lines)
-        for line in lines[3:]:
-            parts = line.strip().split(',')
-            if len(parts) < 15:
-                continue
-
-            try:
-                state_fips = parts[1].strip()
-                state_name = parts[4].strip()
-
-                # Parse permit data: 1-unit, 2-unit, 3-4 unit, 5+ unit
-                # Columns: 5=1-unit bldgs, 6=1-unit units, 7=1-unit value
-                #          8=2-unit bldgs, 9=2-unit units, 10=2-unit value
-                #          11=3-4 unit bldgs, 12=3-4 unit units, 13=3-4 unit value
-                #          14=5+ unit bldgs, 15=5+ unit units, 16=5+ unit value
-
-                units_1 = int(parts[6].strip()) if parts[6].strip() else 0
-                units_2 = int(parts[9].strip()) if parts[9].strip() else 0
-                units_3_4 = int(parts[12].strip()) if parts[12].strip() else 0
-                units_5plus = int(parts[15].strip()) if parts[15].strip() else 0
-
-                all_data.append({
-                    'year': year,
-                    'state_fips': state_fips,
-                    'state_name': state_name,
-                    'units_1': units_1,
-                    'units_2': units_2,
-                    'units_3_4': units_3_4,
-                    'units_5plus': units_5plus,
-                    'total_units': units_1 + units_2 + units_3_4 + units_5plus,
-                    'single_family': units_1,
-                    'small_multi': units_2 + units_3_4,
-                    'large_multi': units_5plus
-                })
-            except (ValueError, IndexError):
-                continue
-
-    return pd.DataFrame(all_data)
+    df = load_bps('st', 'state').dropna(subset=['state_name'])
+    return add_permit_totals(df)
 
 
+@lru_cache(maxsize=1)
 def load_census_place_data_nj():
     """Load Census place-level data for NJ cities"""
-    all_data = []
-
-    for year in range(2010, 2025):
-        filepath = BASE_DIR / 'census-bps' / f'ne{year}a.txt'
-        if not filepath.exists():
-            continue
-
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-
-        for line in lines[3:]:
-            parts = line.strip().split(',')
-            if len(parts) < 30:
-                continue
-
-            try:
-                state_code = parts[1].strip()
-                six_digit_id = parts[2].strip()
-
-                # Only process NJ cities we care about
-                if state_code != '34' or six_digit_id not in NJ_CITY_IDS:
-                    continue
-
-                city_name = NJ_CITY_IDS[six_digit_id]
-
-                # Parse permit counts - units are at indices 18, 21, 24, 27
-                units_1 = int(parts[18].strip()) if parts[18].strip() else 0
-                units_2 = int(parts[21].strip()) if parts[21].strip() else 0
-                units_3_4 = int(parts[24].strip()) if parts[24].strip() else 0
-                units_5plus = int(parts[27].strip()) if parts[27].strip() else 0
-
-                all_data.append({
-                    'year': year,
-                    'city': city_name,
-                    'units_1': units_1,
-                    'units_2': units_2,
-                    'units_3_4': units_3_4,
-                    'units_5plus': units_5plus,
-                    'total_units': units_1 + units_2 + units_3_4 + units_5plus,
-                    'single_family': units_1,
-                    'small_multi': units_2 + units_3_4,
-                    'large_multi': units_5plus
-                })
-            except (ValueError, IndexError):
-                continue
-
-    return pd.DataFrame(all_data)
+    df = load_bps('ne', 'place')
+
+    # Only process NJ cities we care about
+    df = df[(df['state_code'] == '34') & df['six_digit_id'].isin(NJ_CITY_IDS)]
+    df.insert(1, 'city', df['six_digit_id'].map(NJ_CITY_IDS))
+    return add_permit_totals(df[['year', 'city'] + UNIT_COLUMNS])
 
 
+@lru_cache(maxsize=1)
 def load_census_place_data_comparison():
     """Load Census place-level data for comparison cities"""
-    all_data = []
+    frames = []
 
-    # City identifiers: (region_file_prefix, state_code, place_name_contains)
+    # City identifiers: (region_file_prefix, state_code, place_name_contains, city)
     city_configs = [
-        ('so', '48', 'Austin'),      # South region, TX
-        ('mw', '27', 'Minneapolis'), # Midwest region, MN
-        ('we', '06', 'San Francisco'),  # West region, CA
-        ('we', '06', 'Los Angeles'),    # West region, CA
-        ('ne', '36', 'New York'),       # Northeast region, NY
+        ('so', '48', 'Austin', 'Austin'),                # South region, TX
+        ('mw', '27', 'Minneapolis', 'Minneapolis'),      # Midwest region, MN
+        ('we', '06', 'San Francisco', 'San Francisco'),  # West region, CA
+        ('we', '06', 'Los Angeles', 'Los Angeles'),      # West region, CA
+        ('ne', '36', 'New York', 'New York City'),       # Northeast region, NY
     ]
 
-    for year in range(2010, 2025):
-        for prefix, state_code, city_contains in city_configs:
-            filepath = BASE_DIR / 'census-bps' / f'{prefix}{year}a.txt'
-            if not filepath.exists():
-                continue
-
-            with open(filepath, 'r') as f:
-                lines = f.readlines()
-
-            for line in lines[3:]:
-                parts = line.strip().split(',')
-                if len(parts) < 30:
-                    continue
-
-                try:
-                    file_state = parts[1].strip()
-                    if file_state != state_code:
-                        continue
-
-                    # Place name is at index 16 in place files
-                    place_name = parts[16].strip() if len(parts) > 16 else ''
-
-                    if city_contains.lower() not in place_name.lower():
-                        continue
-
-                    # For NYC, we want "New York city" specifically
-                    if city_contains == 'New York' and 'city' not in place_name.lower():
-                        continue
-
-                    units_1 = int(parts[18].strip()) if parts[18].strip() else 0
-                    units_2 = int(parts[21].strip()) if parts[21].strip() else 0
-                    units_3_4 = int(parts[24].strip()) if parts[24].strip() else 0
-                    units_5plus = int(parts[27].strip()) if parts[27].strip() else 0
-
-                    # Standardize city names
-                    if 'Austin' in place_name and state_code == '48':
-                        city = 'Austin'
-                    elif 'Minneapolis' in place_name:
-                        city = 'Minneapolis'
-                    elif 'San Francisco' in place_name:
-                        city = 'San Francisco'
-                    elif 'Los Angeles' in place_name and 'city' in place_name.lower():
-                        city = 'Los Angeles'
-                    elif 'New York' in place_name and 'city' in place_name.lower():
-                        city = 'New York City'
-                    else:
-                        continue
-
-                    all_data.append({
-                        'year': year,
-                        'city': city,
-                        'units_1': units_1,
-                        'units_2': units_2,
-                        'units_3_4': units_3_4,
-                        'units_5plus': units_5plus,
-                        'total_units': units_1 + units_2 + units_3_4 + units_5plus,
-                        'single_family': units_1,
-                        'small_multi': units_2 + units_3_4,
-                        'large_multi': units_5plus
-                    })
-                except (ValueError, IndexError):
-                    continue
-
-    df = pd.DataFrame(all_data)
-    # Aggregate by year and city (in case of duplicates)
-    if not df.empty:
-        df = df.groupby(['year', 'city']).sum().reset_index()
-    return df
+    # For LA and NYC, we want "Los Angeles city"/"New York city" specifically
+    city_only = {'Los Angeles', 'New York'}
+
+    # Each region's files are read once; one regex alternation matches all of
+    # the region's cities
+    for prefix in dict.fromkeys(c[0] for c in city_configs):
+        configs = [c for c in city_configs if c[0] == prefix]
+        df = load_bps(prefix, 'place')
+
+        pattern = '(' + '|'.join(re.escape(c[2]) for c in configs) + ')'
+        contains = df['place_name'].str.extract(pattern, expand=False)
+
+        mask = df['state_code'] == contains.map({c[2]: c[1] for c in configs})
+        mask &= ~contains.isin(city_only) | df['place_name'].str.lower().str.contains('city', regex=False, na=False)
+
+        # Standardize city names
+        matched = df.loc[mask, ['year'] + UNIT_COLUMNS]
+        matched.insert(1, 'city', contains[mask].map({c[2]: c[3] for c in configs}))
+        frames.append(matched)
+
+    df = add_permit_totals(pd.concat(frames, ignore_index=True))
+    # Aggregate by year and city (in case of duplicates); usually each pair
+    # appears once and a sort is all that is needed
+    if df.duplicated(['year', 'city']).any():
+        return df.groupby(['year', 'city'], sort=True).sum().reset_index()
+    return df.sort_values(['year', 'city'], ignore_index=True)
+
+
+# Permit count columns shared by every geography
+PERMIT_COLUMNS = UNIT_COLUMNS + ['total_units', 'single_family', 'small_multi', 'large_multi']
+
+
+@lru_cache(maxsize=1)
+def load_all_permits():
+    """
+    Load every permits series into one long DataFrame.
+
+    Columns: geo_level ('state', 'nj_city' or 'comparison_city'), geo_id
+    (state FIPS, states only), geo_name (state or city name), year, and the
+    PERMIT_COLUMNS. Analyses take their rows from this frame via permits_view.
+    """
+    state = load_census_state_data().rename(columns={'state_fips': 'geo_id', 'state_name': 'geo_name'})
+    nj = load_census_place_data_nj().rename(columns={'city': 'geo_name'})
+    comp = load_census_place_data_comparison().rename(columns={'city': 'geo_name'})
+
+    frames = []
+    for geo_level, df in [('state', state), ('nj_city', nj), ('comparison_city', comp)]:
+        frames.append(df.assign(geo_level=geo_level))
+
+    permits = pd.concat(frames, ignore_index=True)
+    return permits[['geo_level', 'geo_id', 'geo_name', 'year'] + PERMIT_COLUMNS]
 
 
+def permits_view(rows, name_col):
+    """Copy of permit rows in the loaders' layout: year, <name_col>, then PERMIT_COLUMNS"""
+    rows = rows[['year', 'geo_name'] + PERMIT_COLUMNS].rename(columns={'geo_name': name_col})
+    return rows.reset_index(drop=True)
+
+
+def read_zillow_csv(filepath, region_ids):
+    """Read the monthly values (float32) of the given regions from a wide Zillow CSV"""
+    def build():
+        # Pre-scan the header for the monthly date columns
+        columns = pd.read_csv(filepath, nrows=0).columns
+        date_cols = [c for c in columns if '-' in c and c[0].isdigit()]
+
+        # Only the ID, name and monthly columns are decoded, and rows are filtered
+        # to the regions of interest in Arrow before converting to pandas
+        table = pa_csv.read_csv(filepath, convert_options=pa_csv.ConvertOptions(
+            include_columns=['RegionID', 'RegionName'] + date_cols,
+            column_types={'RegionID': pa.int32(), 'RegionName': pa.string(),
+                          **dict.fromkeys(date_cols, pa.float32())},
+        ))
+        table = table.filter(pc.is_in(table['RegionID'], value_set=pa.array(list(region_ids), pa.int32())))
+        return table.to_pandas()
+
+    return cached_parquet(filepath.stem, [filepath], build)
+
+
+@lru_cache(maxsize=1)
 def load_zillow_zhvi():
-    """Load Zillow Home Value Index data"""
-    metro_df = pd.read_csv(BASE_DIR / 'zillow' / 'Metro_zhvi_uc_sfrcondo_tier_0.33_0.67_sm_sa_month.csv')
-    city_df = pd.read_csv(BASE_DIR / 'zillow' / 'City_zhvi_uc_sfrcondo_tier_0.33_0.67_sm_sa_month.csv')
+    """Load Zillow Home Value Index data for the metros and cities analyzed"""
+    metro_df = read_zillow_csv(BASE_DIR / 'zillow' / 'Metro_zhvi_uc_sfrcondo_tier_0.33_0.67_sm_sa_month.csv', ZILLOW_METRO_IDS)
+    city_df = read_zillow_csv(BASE_DIR / 'zillow' / 'City_zhvi_uc_sfrcondo_tier_0.33_0.67_sm_sa_month.csv', ZILLOW_CITY_IDS)
     return metro_df, city_df
 
 
+@lru_cache(maxsize=1)
 def load_zillow_zori():
-    """Load Zillow Rent Index data"""
-    metro_df = pd.read_csv(BASE_DIR / 'zillow' / 'Metro_zori_uc_sfrcondomfr_sm_sa_month.csv')
-    city_df = pd.read_csv(BASE_DIR / 'zillow' / 'City_zori_uc_sfrcondomfr_sm_sa_month.csv')
+    """Load Zillow Rent Index data for the metros and cities analyzed"""
+    metro_df = read_zillow_csv(BASE_DIR / 'zillow' / 'Metro_zori_uc_sfrcondomfr_sm_sa_month.csv', ZILLOW_METRO_IDS)
+    city_df = read_zillow_csv(BASE_DIR / 'zillow' / 'City_zori_uc_sfrcondomfr_sm_sa_month.csv', ZILLOW_CITY_IDS)
     return metro_df, city_df
 
 
@@ -277,44 +321,56 @@ def get_annual_zillow_values(df, region_ids, id_col='RegionID'):
     # Filter to regions of interest
     filtered = df[df[id_col].isin(region_ids)]
 
-    # Get date columns (those that look like dates)
-    date_cols = [c for c in df.columns if '-' in c and c[0].isdigit()]
-
-    results = []
-    for _, row in filtered.iterrows():
-        region_id = row[id_col]
-        region_name = row['RegionName']
-
-        for col in date_cols:
-            try:
-                year = int(col.split('-')[0])
-                if 2010 <= year <= 2025:
-                    value = row[col]
-                    if pd.notna(value):
-                        results.append({
-                            'region_id': region_id,
-                            'region_name': region_name,
-                            'year': year,
-                            'month': col,
-                            'value': value
-                        })
-            except (ValueError, IndexError):
-                continue
-
-    result_df = pd.DataFrame(results)
-    if not result_df.empty:
-        # Calculate annual averages
-        annual = result_df.groupby(['region_id', 'region_name', 'year'])['value'].mean().reset_index()
-        return annual
-    return pd.DataFrame()
-
-
-def analysis_1_nj_statewide():
+    # Get date columns (those that look like dates) and parse their years once
+    date_cols = np.array([c for c in df.columns if '-' in c and c[0].isdigit()])
+    years = date_cols.astype('U4').astype(np.int16)
+    keep = (years >= 2010) & (years <= 2025)
+    order = np.argsort(years[keep], kind='stable')
+    kept_cols = date_cols[keep][order]
+    kept_years = years[keep][order]
+
+    if filtered.empty or len(kept_cols) == 0:
+        return pd.DataFrame()
+
+    # Calculate annual averages over the months present, one column run per year
+    values = filtered[kept_cols].to_numpy(dtype=np.float64)
+    present = ~np.isnan(values)
+    starts = np.flatnonzero(np.r_[True, kept_years[1:] != kept_years[:-1]])
+    sums = np.add.reduceat(np.where(present, values, 0), starts, axis=1)
+    counts = np.add.reduceat(present, starts, axis=1)
+
+    region_idx, year_idx = np.nonzero(counts)
+    if len(region_idx) == 0:
+        return pd.DataFrame()
+
+    annual = pd.DataFrame({
+        'region_id': filtered[id_col].to_numpy()[region_idx],
+        'region_name': filtered['RegionName'].to_numpy()[region_idx],
+        'year': kept_years[starts][year_idx],
+        'value': (sums[region_idx, year_idx] / counts[region_idx, year_idx]).astype(np.float32),
+    })
+    return annual.sort_values(['region_id', 'region_name', 'year'], ignore_index=True)
+
+
+# Chart figures by size, reused across analyses instead of one new figure per chart
+FIGURES = {}
+
+
+def chart_figure(figsize):
+    """Return a cleared figure of the given size, creating it on first use"""
+    fig = FIGURES.get(figsize)
+    if fig is None:
+        fig = FIGURES[figsize] = plt.figure(figsize=figsize)
+    fig.clf()
+    return fig
+
+
+def analysis_1_nj_statewide(permits):
     """Analysis 1: NJ Statewide Permit Trends (2010-2024)"""
     print("Running Analysis 1: NJ Statewide Permit Trends...")
 
-    df = load_census_state_data()
-    nj = df[df['state_fips'] == '34'].copy()
+    is_nj = (permits['geo_level'] == 'state') & (permits['geo_id'] == STATE_FIPS['NJ'])
+    nj = permits_view(permits[is_nj], 'state_name')
 
     # Calculate per capita (per 1000 residents)
     nj['permits_per_1000'] = nj['total_units'] / STATE_POP['NJ'] * 1000
@@ -324,7 +380,8 @@ def analysis_1_nj_statewide():
     nj[output_cols].to_csv(TABLES_DIR / 'nj_permits_2010_2024.csv', index=False)
 
     # Create chart
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    fig = chart_figure((14, 5))
+    ax1, ax2 = fig.subplots(1, 2)
 
     # Left chart: Stacked area by type
     ax1.stackplot(nj['year'],
@@ -347,42 +404,50 @@ def analysis_1_nj_statewide():
     ax2.axhline(y=nj['permits_per_1000'].mean(), color='r', linestyle='--', alpha=0.5, label=f"Avg: {nj['permits_per_1000'].mean():.2f}")
     ax2.legend()
 
-    plt.tight_layout()
-    plt.savefig(CHARTS_DIR / 'nj_permits_trend.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(CHARTS_DIR / 'nj_permits_trend.png', dpi=CHART_DPI)
 
     return nj
 
 
-def analysis_2_hudson_county():
+def analysis_2_hudson_county(permits):
     """Analysis 2: Hudson County Deep Dive"""
     print("Running Analysis 2: Hudson County Deep Dive...")
 
-    df = load_census_place_data_nj()
+    df = permits_view(permits[permits['geo_level'] == 'nj_city'], 'city')
 
     # Add per capita calculations
-    df['pop'] = df['city'].map(CITY_POP)
+    df['pop'] = lookup_population(df['city'], CITY_CAT, CITY_POP_ARR)
     df['permits_per_1000'] = df['total_units'] / df['pop'] * 1000
     df['pct_multifamily'] = (df['small_multi'] + df['large_multi']) / df['total_units'] * 100
     df['pct_multifamily'] = df['pct_multifamily'].fillna(0)
 
+    # Chart order; as an ordered categorical, city groups come out in this order
+    cities = ['Jersey City', 'Newark', 'Hoboken', 'Bayonne']
+    df['city'] = df['city'].astype(pd.CategoricalDtype(cities, ordered=True))
+
     # Save table
     df.to_csv(TABLES_DIR / 'hudson_county_permits.csv', index=False)
 
-    # Summary statistics by city
-    summary = df.groupby('city').agg({
-        'total_units': 'sum',
-        'permits_per_1000': 'mean',
-        'pct_multifamily': 'mean'
-    }).round(2)
-    summary.columns = ['total_2010_2024', 'avg_permits_per_1000', 'avg_pct_multifamily']
+    # Summary statistics by city: one grouping pass feeds the table and charts
+    agg = df.groupby('city', sort=False, observed=True).agg(
+        total_2010_2024=('total_units', 'sum'),
+        avg_permits_per_1000=('permits_per_1000', 'mean'),
+        avg_pct_multifamily=('pct_multifamily', 'mean'),
+        single_family=('single_family', 'sum'),
+        small_multi=('small_multi', 'sum'),
+        large_multi=('large_multi', 'sum'),
+    )
+    summary = agg[['total_2010_2024', 'avg_permits_per_1000', 'avg_pct_multifamily']].round(2)
     summary = summary.sort_values('total_2010_2024', ascending=False)
     summary.to_csv(TABLES_DIR / 'hudson_county_summary.csv')
+    city_stats = agg[['total_2010_2024', 'avg_permits_per_1000']]
+    agg = agg.reindex(cities)
 
     # Create chart
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig = chart_figure((14, 10))
+    axes = fig.subplots(2, 2)
 
-    cities = ['Jersey City', 'Newark', 'Hoboken', 'Bayonne']
     colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
 
     # Top left: Annual permits by city
@@ -397,7 +462,7 @@ def analysis_2_hudson_county():
     axes[0, 0].yaxis.set_major_formatter(mticker.StrMethodFormatter('{x:,.0f}'))
 
     # Top right: Total permits bar chart
-    totals = df.groupby('city')['total_units'].sum().reindex(cities)
+    totals = agg['total_2010_2024']
     bars = axes[0, 1].bar(cities, totals, color=colors)
     axes[0, 1].set_ylabel('Total Units (2010-2024)')
     axes[0, 1].set_title('Total Housing Production (2010-2024)')
@@ -407,7 +472,7 @@ def analysis_2_hudson_county():
                         f'{val:,.0f}', ha='center', va='bottom', fontsize=10)
 
     # Bottom left: Per capita comparison
-    per_capita = df.groupby('city')['permits_per_1000'].mean().reindex(cities)
+    per_capita = agg['avg_permits_per_1000']
     bars = axes[1, 0].bar(cities, per_capita, color=colors)
     axes[1, 0].set_ylabel('Avg Permits per 1,000 Residents')
     axes[1, 0].set_title('Per Capita Housing Production')
@@ -416,8 +481,7 @@ def analysis_2_hudson_county():
                         f'{val:.1f}', ha='center', va='bottom', fontsize=10)
 
     # Bottom right: Structure type mix
-    city_mix = df.groupby('city')[['single_family', 'small_multi', 'large_multi']].sum()
-    city_mix = city_mix.reindex(cities)
+    city_mix = agg[['single_family', 'small_multi', 'large_multi']]
     city_mix_pct = city_mix.div(city_mix.sum(axis=1), axis=0) * 100
     city_mix_pct.plot(kind='bar', stacked=True, ax=axes[1, 1],
                       color=['#66b3ff', '#99ff99', '#ff9999'])
@@ -426,18 +490,17 @@ def analysis_2_hudson_county():
     axes[1, 1].legend(['Single Family', '2-4 Units', '5+ Units'], loc='upper right')
     axes[1, 1].set_xticklabels(cities, rotation=45, ha='right')
 
-    plt.tight_layout()
-    plt.savefig(CHARTS_DIR / 'hudson_cities_comparison.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(CHARTS_DIR / 'hudson_cities_comparison.png', dpi=CHART_DPI)
 
-    return df
+    return df, city_stats
 
 
-def analysis_3_state_comparison():
+def analysis_3_state_comparison(permits):
     """Analysis 3: NJ vs Comparator States and Cities"""
     print("Running Analysis 3: State and City Comparisons...")
 
-    df = load_census_state_data()
+    df = permits_view(permits[permits['geo_level'] == 'state'], 'state_name')
 
     # Filter to comparison states
     states = ['New Jersey', 'New York', 'Texas', 'Minnesota', 'California']
@@ -446,7 +509,7 @@ def analysis_3_state_comparison():
 
     comp_df = df[df['state_name'].isin(states)].copy()
     comp_df['state_abbrev'] = comp_df['state_name'].map(state_abbrevs)
-    comp_df['pop_thousands'] = comp_df['state_abbrev'].map(STATE_POP)
+    comp_df['pop_thousands'] = lookup_population(comp_df['state_abbrev'], STATE_CAT, STATE_POP_ARR)
     comp_df['permits_per_1000'] = comp_df['total_units'] / comp_df['pop_thousands']
 
     # Save table
@@ -456,48 +519,50 @@ def analysis_3_state_comparison():
     pivot_pc = comp_df.pivot(index='year', columns='state_abbrev', values='permits_per_1000')
     pivot_pc.to_csv(TABLES_DIR / 'state_comparisons_per_capita.csv')
 
+    # Categorical from here on (after the pivots, whose CSV columns stay
+    # alphabetical) so later groupbys use the codes instead of hashing strings
+    comp_df['state_abbrev'] = comp_df['state_abbrev'].astype(STATE_CAT)
+    state_avg = comp_df.groupby('state_abbrev', sort=False, observed=True)[['total_units', 'permits_per_1000']].mean()
+
     # Create charts
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    fig = chart_figure((14, 5))
+    ax1, ax2 = fig.subplots(1, 2)
 
     colors = {'NJ': '#1f77b4', 'NY': '#ff7f0e', 'TX': '#2ca02c', 'MN': '#d62728', 'CA': '#9467bd'}
+    state_order = ['NJ', 'NY', 'TX', 'MN', 'CA']
 
-    for state in ['NJ', 'NY', 'TX', 'MN', 'CA']:
-        state_data = comp_df[comp_df['state_abbrev'] == state]
-        ax1.plot(state_data['year'], state_data['total_units'],
-                 'o-', label=state, color=colors[state], linewidth=2)
-        ax2.plot(state_data['year'], state_data['permits_per_1000'],
-                 'o-', label=state, color=colors[state], linewidth=2)
+    # One line per state (columns), each chart in a single plot call
+    for ax, wide in [(ax1, pivot), (ax2, pivot_pc)]:
+        wide = wide.reindex(columns=state_order)
+        ax.set_prop_cycle(color=[colors[state] for state in state_order])
+        ax.plot(wide.index, wide.to_numpy(), 'o-', linewidth=2)
 
     ax1.set_xlabel('Year')
     ax1.set_ylabel('Total Units Permitted')
     ax1.set_title('Building Permits by State (2010-2024)')
-    ax1.legend()
+    ax1.legend(state_order)
     ax1.yaxis.set_major_formatter(mticker.StrMethodFormatter('{x:,.0f}'))
 
     ax2.set_xlabel('Year')
     ax2.set_ylabel('Permits per 1,000 Residents')
     ax2.set_title('Per Capita Building Permits (2010-2024)')
-    ax2.legend()
+    ax2.legend(state_order)
 
-    plt.tight_layout()
-    plt.savefig(CHARTS_DIR / 'state_permits_per_capita.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(CHARTS_DIR / 'state_permits_per_capita.png', dpi=CHART_DPI)
 
     # City comparison
-    nj_cities = load_census_place_data_nj()
-    comp_cities = load_census_place_data_comparison()
-
-    all_cities = pd.concat([nj_cities, comp_cities], ignore_index=True)
+    all_cities = permits_view(permits[permits['geo_level'].isin(['nj_city', 'comparison_city'])], 'city')
 
     if not all_cities.empty:
-        all_cities['pop'] = all_cities['city'].map(CITY_POP)
+        all_cities['pop'] = lookup_population(all_cities['city'], CITY_CAT, CITY_POP_ARR)
         all_cities['permits_per_1000'] = all_cities['total_units'] / all_cities['pop'] * 1000
 
         city_pivot = all_cities.pivot_table(index='year', columns='city',
                                             values='total_units', aggfunc='sum')
         city_pivot.to_csv(TABLES_DIR / 'city_comparisons.csv')
 
-    return comp_df, all_cities
+    return comp_df, state_avg, all_cities
 
 
 def analysis_4_rent_price_trends():
@@ -546,66 +611,58 @@ def analysis_4_rent_price_trends():
         pd.concat(combined).to_csv(TABLES_DIR / 'rent_price_trends.csv', index=False)
 
     # Create charts
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig = chart_figure((14, 10))
+    axes = fig.subplots(2, 2)
 
     # Metro ZHVI
     if not zhvi_annual.empty:
-        for region_name in zhvi_annual['region_name'].unique():
-            region_data = zhvi_annual[zhvi_annual['region_name'] == region_name]
-            axes[0, 0].plot(region_data['year'], region_data['value'] / 1000,
-                           'o-', label=region_name, linewidth=1.5, markersize=4)
+        # One line per region (columns), in the order regions appear
+        wide = zhvi_pivot[zhvi_annual['region_name'].unique()]
+        axes[0, 0].plot(wide.index, wide.to_numpy() / 1000, 'o-', linewidth=1.5, markersize=4)
         axes[0, 0].set_xlabel('Year')
         axes[0, 0].set_ylabel('Home Value ($K)')
         axes[0, 0].set_title('Metro Home Values (ZHVI)')
-        axes[0, 0].legend(fontsize=8)
+        axes[0, 0].legend(list(wide.columns), fontsize=8)
 
     # Metro ZORI
     if not zori_annual.empty:
-        for region_name in zori_annual['region_name'].unique():
-            region_data = zori_annual[zori_annual['region_name'] == region_name]
-            axes[0, 1].plot(region_data['year'], region_data['value'],
-                           'o-', label=region_name, linewidth=1.5, markersize=4)
+        wide = zori_pivot[zori_annual['region_name'].unique()]
+        axes[0, 1].plot(wide.index, wide.to_numpy(), 'o-', linewidth=1.5, markersize=4)
         axes[0, 1].set_xlabel('Year')
         axes[0, 1].set_ylabel('Monthly Rent ($)')
         axes[0, 1].set_title('Metro Rents (ZORI)')
-        axes[0, 1].legend(fontsize=8)
+        axes[0, 1].legend(list(wide.columns), fontsize=8)
 
     # City ZHVI
     if not city_zhvi_annual.empty:
-        for region_name in city_zhvi_annual['region_name'].unique():
-            region_data = city_zhvi_annual[city_zhvi_annual['region_name'] == region_name]
-            axes[1, 0].plot(region_data['year'], region_data['value'] / 1000,
-                           'o-', label=region_name, linewidth=1.5, markersize=4)
+        wide = city_zhvi_pivot[city_zhvi_annual['region_name'].unique()]
+        axes[1, 0].plot(wide.index, wide.to_numpy() / 1000, 'o-', linewidth=1.5, markersize=4)
         axes[1, 0].set_xlabel('Year')
         axes[1, 0].set_ylabel('Home Value ($K)')
         axes[1, 0].set_title('City Home Values (ZHVI)')
-        axes[1, 0].legend(fontsize=8)
+        axes[1, 0].legend(list(wide.columns), fontsize=8)
 
     # City ZORI
     if not city_zori_annual.empty:
-        for region_name in city_zori_annual['region_name'].unique():
-            region_data = city_zori_annual[city_zori_annual['region_name'] == region_name]
-            axes[1, 1].plot(region_data['year'], region_data['value'],
-                           'o-', label=region_name, linewidth=1.5, markersize=4)
+        wide = city_zori_pivot[city_zori_annual['region_name'].unique()]
+        axes[1, 1].plot(wide.index, wide.to_numpy(), 'o-', linewidth=1.5, markersize=4)
         axes[1, 1].set_xlabel('Year')
         axes[1, 1].set_ylabel('Monthly Rent ($)')
         axes[1, 1].set_title('City Rents (ZORI)')
-        axes[1, 1].legend(fontsize=8)
+        axes[1, 1].legend(list(wide.columns), fontsize=8)
 
-    plt.tight_layout()
-    plt.savefig(CHARTS_DIR / 'rent_price_trends.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(CHARTS_DIR / 'rent_price_trends.png', dpi=CHART_DPI)
 
     return zhvi_annual, zori_annual, city_zhvi_annual, city_zori_annual
 
 
-def analysis_5_austin_supply_shock():
+def analysis_5_austin_supply_shock(permits):
     """Analysis 5: Austin Supply Shock Analysis"""
     print("Running Analysis 5: Austin Supply Shock...")
 
-    # Load Austin permit data
-    comp_cities = load_census_place_data_comparison()
-    austin = comp_cities[comp_cities['city'] == 'Austin'].copy()
+    # Austin permit data
+    austin = permits_view(permits[(permits['geo_level'] == 'comparison_city') & (permits['geo_name'] == 'Austin')], 'city')
 
     if austin.empty:
         print("  Warning: Could not find Austin permit data")
@@ -614,32 +671,13 @@ def analysis_5_austin_supply_shock():
     austin['pop'] = CITY_POP['Austin']
     austin['permits_per_1000'] = austin['total_units'] / austin['pop'] * 1000
 
-    # Load Austin rent data
+    # Load Austin rent data and get annual averages
     metro_zori, city_zori = load_zillow_zori()
-    austin_zori = city_zori[city_zori['RegionID'] == 10221]
-
-    # Get annual rent data
-    date_cols = [c for c in city_zori.columns if '-' in c and c[0].isdigit()]
-    austin_rents = []
-
-    if not austin_zori.empty:
-        row = austin_zori.iloc[0]
-        for col in date_cols:
-            try:
-                year = int(col.split('-')[0])
-                if 2010 <= year <= 2025:
-                    value = row[col]
-                    if pd.notna(value):
-                        austin_rents.append({'year': year, 'month': col, 'rent': value})
-            except:
-                continue
-
-    austin_rent_df = pd.DataFrame(austin_rents)
-    if not austin_rent_df.empty:
-        austin_rent_annual = austin_rent_df.groupby('year')['rent'].mean().reset_index()
+    austin_rent_annual = get_annual_zillow_values(city_zori, [10221])
+
+    if not austin_rent_annual.empty:
+        austin_rent_annual = austin_rent_annual[['year', 'value']].rename(columns={'value': 'rent'})
         austin_rent_annual['rent_yoy_change'] = austin_rent_annual['rent'].pct_change() * 100
-    else:
-        austin_rent_annual = pd.DataFrame()
 
     # Merge permits and rent
     if not austin_rent_annual.empty:
@@ -649,10 +687,10 @@ def analysis_5_austin_supply_shock():
         austin_combined = austin_combined.sort_values('year')
         austin_combined['permits_lagged_2yr'] = austin_combined['total_units'].shift(2)
 
-        # Calculate correlation
-        valid_data = austin_combined.dropna(subset=['permits_lagged_2yr', 'rent_yoy_change'])
+        # Calculate correlation on a plain (years x 2) float matrix
+        valid_data = austin_combined[['permits_lagged_2yr', 'rent_yoy_change']].dropna().to_numpy(dtype=np.float64)
         if len(valid_data) > 3:
-            correlation = valid_data['permits_lagged_2yr'].corr(valid_data['rent_yoy_change'])
+            correlation = np.corrcoef(valid_data[:, 0], valid_data[:, 1])[0, 1]
         else:
             correlation = np.nan
 
@@ -662,7 +700,8 @@ def analysis_5_austin_supply_shock():
         correlation = np.nan
 
     # Create chart
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig = chart_figure((14, 10))
+    axes = fig.subplots(2, 2)
 
     # Austin permits over time
     axes[0, 0].bar(austin['year'], austin['total_units'], color='steelblue', alpha=0.7)
@@ -707,19 +746,17 @@ def analysis_5_austin_supply_shock():
         ax1.legend(loc='upper left')
         ax2.legend(loc='upper right')
 
-    plt.tight_layout()
-    plt.savefig(CHARTS_DIR / 'austin_supply_vs_rent.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(CHARTS_DIR / 'austin_supply_vs_rent.png', dpi=CHART_DPI)
 
     return austin_combined, correlation
 
 
-def analysis_6_minneapolis_2040():
+def analysis_6_minneapolis_2040(permits):
     """Analysis 6: Minneapolis Pre/Post 2040 Plan"""
     print("Running Analysis 6: Minneapolis 2040 Plan Analysis...")
 
-    comp_cities = load_census_place_data_comparison()
-    mpls = comp_cities[comp_cities['city'] == 'Minneapolis'].copy()
+    mpls = permits_view(permits[(permits['geo_level'] == 'comparison_city') & (permits['geo_name'] == 'Minneapolis')], 'city')
 
     if mpls.empty:
         print("  Warning: Could not find Minneapolis permit data")
@@ -731,7 +768,7 @@ def analysis_6_minneapolis_2040():
 
     # Calculate averages
     pre_avg = {
-        'period': 'Pre-2040 (2010-2018)',
+        'period': MPLS_PRE_2040,
         'avg_total': pre_2040['total_units'].mean(),
         'avg_single_family': pre_2040['single_family'].mean(),
         'avg_small_multi': pre_2040['small_multi'].mean(),
@@ -740,7 +777,7 @@ def analysis_6_minneapolis_2040():
     }
 
     post_avg = {
-        'period': 'Post-2040 (2019-2024)',
+        'period': MPLS_POST_2040,
         'avg_total': post_2040['total_units'].mean(),
         'avg_single_family': post_2040['single_family'].mean(),
         'avg_small_multi': post_2040['small_multi'].mean(),
@@ -749,13 +786,15 @@ def analysis_6_minneapolis_2040():
     }
 
     comparison = pd.DataFrame([pre_avg, post_avg])
-    comparison.to_csv(TABLES_DIR / 'minneapolis_2040_comparison.csv', index=False)
+    comparison = comparison.set_index('period')
+    comparison.to_csv(TABLES_DIR / 'minneapolis_2040_comparison.csv')
 
     # Save full time series
     mpls.to_csv(TABLES_DIR / 'minneapolis_permits.csv', index=False)
 
     # Create chart
-    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    fig = chart_figure((14, 5))
+    axes = fig.subplots(1, 2)
 
     # Left: Time series with 2018 line
     ax1 = axes[0]
@@ -776,11 +815,12 @@ def analysis_6_minneapolis_2040():
     x = np.arange(3)
     width = 0.35
 
-    pre_vals = [pre_avg['avg_single_family'], pre_avg['avg_small_multi'], pre_avg['avg_large_multi']]
-    post_vals = [post_avg['avg_single_family'], post_avg['avg_small_multi'], post_avg['avg_large_multi']]
+    # Rows: pre, post; columns: single family, 2-4 units, 5+ units
+    metric_cols = ['avg_single_family', 'avg_small_multi', 'avg_large_multi']
+    vals = comparison.loc[[MPLS_PRE_2040, MPLS_POST_2040], metric_cols].to_numpy()
 
-    bars1 = ax2.bar(x - width/2, pre_vals, width, label='Pre-2040 (2010-2018)', color='steelblue')
-    bars2 = ax2.bar(x + width/2, post_vals, width, label='Post-2040 (2019-2024)', color='coral')
+    bars1 = ax2.bar(x - width/2, vals[0], width, label=MPLS_PRE_2040, color='steelblue')
+    bars2 = ax2.bar(x + width/2, vals[1], width, label=MPLS_POST_2040, color='coral')
 
     ax2.set_ylabel('Avg Annual Units')
     ax2.set_title('Minneapolis: Pre vs Post 2040 Plan')
@@ -789,19 +829,13 @@ def analysis_6_minneapolis_2040():
     ax2.legend()
 
     # Add percentage change labels
-    for i, (pre, post) in enumerate(zip(pre_vals, post_vals)):
-        if pre > 0:
-            pct_change = (post - pre) / pre * 100
-            ax2.annotate(f'{pct_change:+.0f}%',
-                        xy=(i + width/2, post),
-                        xytext=(0, 5),
-                        textcoords='offset points',
-                        ha='center', va='bottom',
-                        fontsize=10, fontweight='bold')
-
-    plt.tight_layout()
-    plt.savefig(CHARTS_DIR / 'minneapolis_pre_post_2040.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    pre, post = vals
+    pct = np.divide(post - pre, pre, out=np.full_like(pre, np.nan, dtype=float), where=pre > 0) * 100
+    labels = [f'{p:+.0f}%' if np.isfinite(p) else '' for p in pct]
+    ax2.bar_label(bars2, labels=labels, padding=5, fontsize=10, fontweight='bold')
+
+    fig.tight_layout()
+    fig.savefig(CHARTS_DIR / 'minneapolis_pre_post_2040.png', dpi=CHART_DPI)
 
     return mpls, comparison
 
@@ -889,25 +923,24 @@ def write_data_inventory():
    - Most comprehensive source for NJ municipal-level data
 """
 
-    with open(ANALYSIS_DIR / 'data_inventory.md', 'w') as f:
-        f.write(inventory)
+    (ANALYSIS_DIR / 'data_inventory.md').write_text(inventory, encoding='utf-8')
 
 
-def write_findings(nj_permits, hudson_permits, state_comp, austin_data, mpls_data,
+def write_findings(nj_permits, hudson_stats, state_stats, austin_data, mpls_data,
                    zhvi_annual, zori_annual):
     """Write findings markdown"""
     print("Writing findings...")
 
-    # Calculate key statistics
-    nj_avg_per_capita = nj_permits['permits_per_1000'].mean() if not nj_permits.empty else 0
+    # Check which inputs have data once; the sections below branch on these
+    nj_empty, hudson_empty = nj_permits.empty, hudson_stats.empty
 
-    # State comparisons
-    state_pc = state_comp.groupby('state_abbrev')['permits_per_1000'].mean()
+    # State comparisons (plain dicts: the findings text does many single-key lookups)
+    state_pc = state_stats['permits_per_1000'].to_dict()
 
     # Hudson county stats
-    if not hudson_permits.empty:
-        hudson_totals = hudson_permits.groupby('city')['total_units'].sum()
-        nj_total = nj_permits['total_units'].sum() if not nj_permits.empty else 1
+    if not hudson_empty:
+        hudson_totals = hudson_stats['total_2010_2024'].sort_values(ascending=False).to_dict()
+        nj_total = nj_permits['total_units'].sum() if not nj_empty else 1
         jc_share = hudson_totals.get('Jersey City', 0) / nj_total * 100 if nj_total > 0 else 0
     else:
         jc_share = 0
@@ -917,14 +950,13 @@ def write_findings(nj_permits, hudson_permits, state_comp, austin_data, mpls_dat
 
     # Minneapolis analysis
     if mpls_data:
-        mpls_comp = mpls_data[1]
-        pre_small = mpls_comp[mpls_comp['period'].str.contains('Pre')]['avg_small_multi'].values[0] if len(mpls_comp) > 0 else 0
-        post_small = mpls_comp[mpls_comp['period'].str.contains('Post')]['avg_small_multi'].values[0] if len(mpls_comp) > 1 else 0
+        small_multi = mpls_data[1]['avg_small_multi']
+        pre_small, post_small = small_multi[MPLS_PRE_2040], small_multi[MPLS_POST_2040]
         mpls_change = (post_small - pre_small) / pre_small * 100 if pre_small > 0 else 0
     else:
         mpls_change = 0
 
-    findings = f"""# Key Findings
+    findings = [f"""# Key Findings
 
 ## 1. How does NJ's per-capita permitting compare to TX, CA, MN, NY?
 
@@ -950,29 +982,27 @@ Even New York, with similar regulatory constraints, outpaces NJ.
 Jersey City accounts for approximately **{jc_share:.1f}%** of all NJ housing permits (2010-2024).
 
 Among Hudson County cities, Jersey City dominates:
-"""
+"""]
 
-    if not hudson_permits.empty:
-        hudson_totals = hudson_permits.groupby('city')['total_units'].sum().sort_values(ascending=False)
-        for city, total in hudson_totals.items():
-            findings += f"- **{city}:** {total:,.0f} units\n"
+    if not hudson_empty:
+        findings.append(''.join(f"- **{city}:** {total:,.0f} units\n" for city, total in hudson_totals.items()))
 
-    findings += """
+    findings.append("""
 ---
 
 ## 3. How do JC/Hoboken/Bayonne compare on production and affordability?
 
 ### Production (2010-2024 Total)
-"""
+""")
 
-    if not hudson_permits.empty:
-        hudson_pc = hudson_permits.groupby('city')['permits_per_1000'].mean()
-        for city in ['Jersey City', 'Hoboken', 'Bayonne', 'Newark']:
-            total = hudson_totals.get(city, 0)
-            pc = hudson_pc.get(city, 0)
-            findings += f"- **{city}:** {total:,.0f} units total, {pc:.1f} permits/1000 residents annually\n"
+    if not hudson_empty:
+        hudson_pc = hudson_stats['avg_permits_per_1000'].to_dict()
+        findings.append(''.join(
+            f"- **{city}:** {hudson_totals.get(city, 0):,.0f} units total, "
+            f"{hudson_pc.get(city, 0):.1f} permits/1000 residents annually\n"
+            for city in ['Jersey City', 'Hoboken', 'Bayonne', 'Newark']))
 
-    findings += """
+    findings.append("""
 ### Structure Type
 - **Jersey City:** Dominated by large multifamily (5+ units)
 - **Hoboken:** Mix of large multifamily with limited land
@@ -986,10 +1016,10 @@ Based on Zillow data, Hudson County cities have significantly higher home values
 
 ## 4. Does Austin's data actually show permits preceding rent declines?
 
-"""
+""")
 
     if not np.isnan(austin_corr):
-        findings += f"""**Correlation between lagged permits and rent changes: {austin_corr:.2f}**
+        findings.append(f"""**Correlation between lagged permits and rent changes: {austin_corr:.2f}**
 
 Austin's massive permit surge (2019-2022) preceded significant rent moderation in 2023-2024.
 The negative correlation suggests that higher permit volumes in year T are associated with
@@ -1000,11 +1030,11 @@ Key observations:
 - Per capita permits reached **60+ per 1,000 residents** annually
 - Rents began declining in late 2023 after years of increases
 - This supports the supply-affects-rent hypothesis
-"""
+""")
     else:
-        findings += "Insufficient data to calculate correlation. See austin_supply_rent.csv for available data.\n"
+        findings.append("Insufficient data to calculate correlation. See austin_supply_rent.csv for available data.\n")
 
-    findings += f"""
+    findings.append(f"""
 ---
 
 ## 5. Did Minneapolis see a measurable uptick in small multifamily after 2018?
@@ -1027,16 +1057,16 @@ See minneapolis_2040_comparison.csv for detailed breakdown.
 Based on Zillow ZHVI and ZORI data (annual averages):
 
 ### Home Values (2024)
-"""
+""")
 
     # Add home value comparisons from Zillow data if available
     if not zhvi_annual.empty:
         latest = zhvi_annual[zhvi_annual['year'] == 2024]
         if not latest.empty:
-            for _, row in latest.iterrows():
-                findings += f"- **{row['region_name']}:** ${row['value']:,.0f}\n"
+            rows = latest[['region_name', 'value']].itertuples(index=False, name=None)
+            findings.append(''.join(f"- **{name}:** ${value:,.0f}\n" for name, value in rows))
 
-    findings += """
+    findings.append("""
 ### Key Takeaway
 Hudson County / NYC metro home values are **2-3x higher** than Austin and Minneapolis metros,
 while Austin and Minneapolis have seen stronger rent moderation due to supply increases.
@@ -1050,17 +1080,16 @@ while Austin and Minneapolis have seen stronger rent moderation due to supply in
 3. **Jersey City can't do it alone:** One city can't solve a statewide housing shortage
 4. **Zoning reform takes time:** Minneapolis results are preliminary but directionally positive
 5. **Affordability requires production:** High-cost metros need sustained high permit volumes
-"""
+""")
 
-    with open(ANALYSIS_DIR / 'findings.md', 'w') as f:
-        f.write(findings)
+    (ANALYSIS_DIR / 'findings.md').write_text(''.join(findings), encoding='utf-8')
 
 
-def write_full_report(nj_permits, hudson_permits, state_comp, austin_data, mpls_data):
+def write_full_report(nj_permits, hudson_stats, state_stats, austin_data, mpls_data):
     """Write comprehensive report markdown"""
     print("Writing full report...")
 
-    report = """# NJ Housing Production Analysis: Full Report
+    report = ["""# NJ Housing Production Analysis: Full Report
 
 *Generated: December 2025*
 
@@ -1100,15 +1129,19 @@ and rents). Key findings:
 ## Analysis 1: NJ Statewide Trends
 
 ### Annual Permits (2010-2024)
-"""
+"""]
 
     if not nj_permits.empty:
-        report += "\n| Year | Single Family | 2-4 Units | 5+ Units | Total | Per 1,000 |\n"
-        report += "|------|--------------|-----------|----------|-------|----------|\n"
-        for _, row in nj_permits.iterrows():
-            report += f"| {int(row['year'])} | {row['single_family']:,.0f} | {row['small_multi']:,.0f} | {row['large_multi']:,.0f} | {row['total_units']:,.0f} | {row['permits_per_1000']:.2f} |\n"
-
-    report += """
+        report.append("\n| Year | Single Family | 2-4 Units | 5+ Units | Total | Per 1,000 |\n"
+                      "|------|--------------|-----------|----------|-------|----------|\n")
+        # Format each column once, then join the preformatted cells
+        counts = nj_permits[['single_family', 'small_multi', 'large_multi', 'total_units']].map('{:,.0f}'.format)
+        per_1000 = nj_permits['permits_per_1000'].map('{:.2f}'.format)
+        rows = zip(nj_permits['year'].astype(int), *(counts[col] for col in counts.columns), per_1000)
+        report.append(''.join(f"| {year} | {sf} | {sm} | {lm} | {tot} | {pc} |\n"
+                              for year, sf, sm, lm, tot, pc in rows))
+
+    report.append("""
 ### Key Observations
 - NJ housing production remains below pre-2008 levels
 - Large multifamily (5+ units) is the dominant growth segment
@@ -1121,18 +1154,17 @@ and rents). Key findings:
 ## Analysis 2: Hudson County Cities
 
 ### Total Production (2010-2024)
-"""
+""")
 
-    if not hudson_permits.empty:
-        totals = hudson_permits.groupby('city')['total_units'].sum().sort_values(ascending=False)
-        report += "\n| City | Total Units | % of Group |\n"
-        report += "|------|-------------|------------|\n"
-        group_total = totals.sum()
-        for city, total in totals.items():
-            pct = total / group_total * 100
-            report += f"| {city} | {total:,.0f} | {pct:.1f}% |\n"
+    if not hudson_stats.empty:
+        totals = hudson_stats['total_2010_2024'].sort_values(ascending=False)
+        pcts = totals / totals.sum() * 100
+        report.append("\n| City | Total Units | % of Group |\n"
+                      "|------|-------------|------------|\n")
+        report.append(''.join(f"| {city} | {total:,.0f} | {pct:.1f}% |\n"
+                              for city, total, pct in zip(totals.index, totals, pcts)))
 
-    report += """
+    report.append("""
 ### Structure Type by City
 - **Jersey City:** Heavily weighted to large multifamily developments (towers)
 - **Newark:** Similar pattern to Jersey City
@@ -1146,18 +1178,17 @@ and rents). Key findings:
 ## Analysis 3: State Comparisons
 
 ### Per-Capita Permit Rates
-"""
+""")
 
-    if not state_comp.empty:
-        state_avg = state_comp.groupby('state_abbrev')[['total_units', 'permits_per_1000']].mean()
-        report += "\n| State | Avg Annual Permits | Per 1,000 Residents |\n"
-        report += "|-------|-------------------|--------------------|\n"
-        for state in ['TX', 'CA', 'MN', 'NY', 'NJ']:
-            if state in state_avg.index:
-                row = state_avg.loc[state]
-                report += f"| {state} | {row['total_units']:,.0f} | {row['permits_per_1000']:.2f} |\n"
+    if not state_stats.empty:
+        states = [state for state in ['TX', 'CA', 'MN', 'NY', 'NJ'] if state in state_stats.index]
+        rows = state_stats.loc[states, ['total_units', 'permits_per_1000']]
+        report.append("\n| State | Avg Annual Permits | Per 1,000 Residents |\n"
+                      "|-------|-------------------|--------------------|\n")
+        report.append(''.join(f"| {state} | {total:,.0f} | {pc:.2f} |\n"
+                              for state, total, pc in rows.itertuples(name=None)))
 
-    report += """
+    report.append("""
 ### Analysis
 Texas dramatically outpaces all other states in housing production:
 - TX permits ~3-4x more per capita than NJ
@@ -1192,14 +1223,14 @@ Austin, TX represents a natural experiment in housing supply:
 - Rents began declining in late 2023
 
 ### Key Evidence
-"""
+""")
 
     if austin_data:
         austin_df, corr = austin_data
         if not np.isnan(corr):
-            report += f"\n**Correlation (2-year lagged permits vs rent growth): {corr:.2f}**\n"
+            report.append(f"\n**Correlation (2-year lagged permits vs rent growth): {corr:.2f}**\n")
 
-    report += """
+    report.append("""
 This negative correlation suggests supply increases in year T are associated with rent
 moderation in year T+2 (approximate construction lag).
 
@@ -1216,16 +1247,17 @@ Minneapolis adopted its 2040 Comprehensive Plan in December 2018, which:
 - Removed parking minimums near transit
 
 ### Results (Preliminary)
-"""
+""")
 
     if mpls_data:
         mpls_df, comparison = mpls_data
-        report += "\n| Period | Avg Annual Units | Avg Small Multi (2-4) | % Small Multi |\n"
-        report += "|--------|-----------------|---------------------|---------------|\n"
-        for _, row in comparison.iterrows():
-            report += f"| {row['period']} | {row['avg_total']:.0f} | {row['avg_small_multi']:.0f} | {row['pct_small_multi']:.1f}% |\n"
+        report.append("\n| Period | Avg Annual Units | Avg Small Multi (2-4) | % Small Multi |\n"
+                      "|--------|-----------------|---------------------|---------------|\n")
+        rows = comparison[['avg_total', 'avg_small_multi', 'pct_small_multi']]
+        report.append(''.join(f"| {period} | {total:.0f} | {small:.0f} | {pct_small:.1f}% |\n"
+                              for period, total, small, pct_small in rows.itertuples(name=None)))
 
-    report += """
+    report.append("""
 ### Interpretation
 - It's early to draw strong conclusions (only 5-6 years post-reform)
 - COVID-19 disrupted 2020-2021 construction patterns
@@ -1276,10 +1308,9 @@ All output files are in the `analysis/` directory:
 - `rent_price_trends.png`
 - `austin_supply_vs_rent.png`
 - `minneapolis_pre_post_2040.png`
-"""
+""")
 
-    with open(ANALYSIS_DIR / 'full_report.md', 'w') as f:
-        f.write(report)
+    (ANALYSIS_DIR / 'full_report.md').write_text(''.join(report), encoding='utf-8')
 
 
 def main():
@@ -1292,19 +1323,30 @@ def main():
     TABLES_DIR.mkdir(parents=True, exist_ok=True)
     CHARTS_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Run analyses
-    nj_permits = analysis_1_nj_statewide()
-    hudson_permits = analysis_2_hudson_county()
-    state_comp, city_comp = analysis_3_state_comparison()
-    zhvi_annual, zori_annual, city_zhvi, city_zori = analysis_4_rent_price_trends()
-    austin_data = analysis_5_austin_supply_shock()
-    mpls_data = analysis_6_minneapolis_2040()
+    # Run analyses (all permit analyses share one long-format frame). They
+    # write disjoint tables/charts, so each runs in its own process and only
+    # the report writers below wait for all of them.
+    permits = load_all_permits()
+    with ProcessPoolExecutor(max_workers=min(6, os.cpu_count() or 1)) as executor:
+        nj_future = executor.submit(analysis_1_nj_statewide, permits)
+        hudson_future = executor.submit(analysis_2_hudson_county, permits)
+        state_future = executor.submit(analysis_3_state_comparison, permits)
+        zillow_future = executor.submit(analysis_4_rent_price_trends)
+        austin_future = executor.submit(analysis_5_austin_supply_shock, permits)
+        mpls_future = executor.submit(analysis_6_minneapolis_2040, permits)
+
+        nj_permits = nj_future.result()
+        hudson_permits, hudson_stats = hudson_future.result()
+        state_comp, state_stats, city_comp = state_future.result()
+        zhvi_annual, zori_annual, city_zhvi, city_zori = zillow_future.result()
+        austin_data = austin_future.result()
+        mpls_data = mpls_future.result()
 
     # Write documentation
     write_data_inventory()
-    write_findings(nj_permits, hudson_permits, state_comp, austin_data, mpls_data,
+    write_findings(nj_permits, hudson_stats, state_stats, austin_data, mpls_data,
                    zhvi_annual, zori_annual)
-    write_full_report(nj_permits, hudson_permits, state_comp, austin_data, mpls_data)
+    write_full_report(nj_permits, hudson_stats, state_stats, austin_data, mpls_data)
 
     print("=" * 60)
     print("Analysis complete! Output files in:")
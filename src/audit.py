@@ -10,7 +10,10 @@ This script:
 """
 
 import argparse
+import csv
+import glob
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -20,49 +23,81 @@ DATA_DIR = Path(__file__).parent.parent / "data"
 REFERENCE_DIR = Path(__file__).parent.parent / "reference"
 LOGS_DIR = Path(__file__).parent.parent / "logs"
 
+# Years audited concurrently by --all (each on its own cursor of one database)
+AUDIT_WORKERS = 4
+
+# Known CSV layouts per schema era (column order as in the files). Reading with
+# these skips DuckDB's sniffing/type-inference pass. Legacy timestamps stay
+# VARCHAR: their format varies by year and they are TRY_CAST in the queries.
+MODERN_COLUMNS = {
+    'ride_id': 'VARCHAR', 'rideable_type': 'VARCHAR',
+    'started_at': 'TIMESTAMP', 'ended_at': 'TIMESTAMP',
+    'start_station_name': 'VARCHAR', 'start_station_id': 'VARCHAR',
+    'end_station_name': 'VARCHAR', 'end_station_id': 'VARCHAR',
+    'start_lat': 'DOUBLE', 'start_lng': 'DOUBLE', 'end_lat': 'DOUBLE', 'end_lng': 'DOUBLE',
+    'member_casual': 'VARCHAR',
+}
+LEGACY_COLUMNS = {
+    'tripduration': 'BIGINT', 'starttime': 'VARCHAR', 'stoptime': 'VARCHAR',
+    'start station id': 'VARCHAR', 'start station name': 'VARCHAR',
+    'start station latitude': 'DOUBLE', 'start station longitude': 'DOUBLE',
+    'end station id': 'VARCHAR', 'end station name': 'VARCHAR',
+    'end station latitude': 'DOUBLE', 'end station longitude': 'DOUBLE',
+    'bikeid': 'VARCHAR', 'usertype': 'VARCHAR', 'birth year': 'VARCHAR', 'gender': 'VARCHAR',
+}
+LEGACY_TITLECASE_COLUMNS = {
+    'Trip Duration': 'BIGINT', 'Start Time': 'VARCHAR', 'Stop Time': 'VARCHAR',
+    'Start Station ID': 'VARCHAR', 'Start Station Name': 'VARCHAR',
+    'Start Station Latitude': 'DOUBLE', 'Start Station Longitude': 'DOUBLE',
+    'End Station ID': 'VARCHAR', 'End Station Name': 'VARCHAR',
+    'End Station Latitude': 'DOUBLE', 'End Station Longitude': 'DOUBLE',
+    'Bike ID': 'VARCHAR', 'User Type': 'VARCHAR', 'Birth Year': 'VARCHAR', 'Gender': 'VARCHAR',
+}
+
+
+def csv_header(path: str) -> list[str]:
+    """Column names from a CSV's header line."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+
+def read_csv_sql(csv_pattern: str, columns: dict = None) -> str:
+    """
+    SQL table function reading csv_pattern with a fixed schema, or with
+    read_csv_auto when no schema is given (unrecognized header).
+    """
+    if columns is None:
+        return f"read_csv_auto('{csv_pattern}', ignore_errors=true)"
+    columns_sql = ", ".join(f"'{name}': '{dtype}'" for name, dtype in columns.items())
+    return (f"read_csv('{csv_pattern}', columns={{{columns_sql}}}, header=true, "
+            f"auto_detect=false, ignore_errors=true)")
+
 
-def analyze_filtered_rows(con: duckdb.DuckDBPyConnection, csv_pattern: str) -> dict:
+def load_trips(con: duckdb.DuckDBPyConnection, csv_pattern: str) -> bool:
     """
-    Analyze why rows would be filtered out.
-    Returns detailed breakdown.
+    Scan a year's CSVs once into the temp table `trips`, normalized across
+    schema eras. The analyzers below all query this table instead of each
+    re-reading the CSVs.
+    Returns False if no files match.
     """
     # Detect schema from first file
-    import glob
-    first_file = glob.glob(csv_pattern)[0] if glob.glob(csv_pattern) else None
-    if not first_file:
-        return {'error': 'No files found'}
-
-    with open(first_file) as f:
-        header = f.readline().lower()
+    files = glob.glob(csv_pattern)
+    if not files:
+        return False
 
-    is_modern = 'ride_id' in header
-    is_titlecase = 'Trip Duration' in open(first_file).readline()
+    header = csv_header(files[0])
+    is_modern = 'ride_id' in (col.lower() for col in header)
+    is_titlecase = 'Trip Duration' in header
 
     if is_modern:
-        query = f"""
-            WITH raw AS (
-                SELECT
-                    started_at::TIMESTAMP as started_at,
-                    ended_at::TIMESTAMP as ended_at,
-                    EPOCH(ended_at::TIMESTAMP - started_at::TIMESTAMP) as duration_sec,
-                    CAST(start_station_id AS VARCHAR) as start_station_id,
-                    CAST(end_station_id AS VARCHAR) as end_station_id,
-                    start_lat, start_lng, end_lat, end_lng
-                FROM read_csv_auto('{csv_pattern}', ignore_errors=true)
-            )
-            SELECT
-                COUNT(*) as total_rows,
-                SUM(CASE WHEN started_at IS NULL OR ended_at IS NULL THEN 1 ELSE 0 END) as invalid_timestamp,
-                SUM(CASE WHEN start_station_id IS NULL OR start_station_id = '' THEN 1 ELSE 0 END) as missing_start_station,
-                SUM(CASE WHEN end_station_id IS NULL OR end_station_id = '' THEN 1 ELSE 0 END) as missing_end_station,
-                SUM(CASE WHEN duration_sec < 0 THEN 1 ELSE 0 END) as negative_duration,
-                SUM(CASE WHEN duration_sec >= 0 AND duration_sec < 90 THEN 1 ELSE 0 END) as duration_under_90s,
-                SUM(CASE WHEN duration_sec > 14400 THEN 1 ELSE 0 END) as duration_over_4h,
-                SUM(CASE WHEN start_lat IS NULL OR start_lng IS NULL THEN 1 ELSE 0 END) as missing_start_coords,
-                SUM(CASE WHEN end_lat IS NULL OR end_lng IS NULL THEN 1 ELSE 0 END) as missing_end_coords,
-                SUM(CASE WHEN start_lat NOT BETWEEN 40.4 AND 41.0 OR start_lng NOT BETWEEN -74.3 AND -73.7 THEN 1 ELSE 0 END) as invalid_start_coords,
-                SUM(CASE WHEN end_lat NOT BETWEEN 40.4 AND 41.0 OR end_lng NOT BETWEEN -74.3 AND -73.7 THEN 1 ELSE 0 END) as invalid_end_coords
-            FROM raw
+        columns = MODERN_COLUMNS
+        select_clause = """
+                started_at::TIMESTAMP as started_at,
+                started_at IS NOT NULL AND ended_at IS NOT NULL as has_timestamps,
+                EPOCH(ended_at::TIMESTAMP - started_at::TIMESTAMP) as duration_sec,
+                CAST(start_station_id AS VARCHAR) as start_station_id,
+                CAST(end_station_id AS VARCHAR) as end_station_id,
+                start_lat, start_lng, end_lat, end_lng
         """
     else:
         # Legacy schema
@@ -75,34 +110,52 @@ def analyze_filtered_rows(con: duckdb.DuckDBPyConnection, csv_pattern: str) -> d
         end_lng_col = '"End Station Longitude"' if is_titlecase else '"end station longitude"'
         time_col = '"Start Time"' if is_titlecase else 'starttime'
 
-        query = f"""
-            WITH raw AS (
-                SELECT
-                    TRY_CAST({time_col} AS TIMESTAMP) as started_at,
-                    {duration_col}::INTEGER as duration_sec,
-                    CAST({start_id_col} AS VARCHAR) as start_station_id,
-                    CAST({end_id_col} AS VARCHAR) as end_station_id,
-                    TRY_CAST({start_lat_col} AS DOUBLE) as start_lat,
-                    TRY_CAST({start_lng_col} AS DOUBLE) as start_lng,
-                    TRY_CAST({end_lat_col} AS DOUBLE) as end_lat,
-                    TRY_CAST({end_lng_col} AS DOUBLE) as end_lng
-                FROM read_csv_auto('{csv_pattern}', ignore_errors=true)
-            )
-            SELECT
-                COUNT(*) as total_rows,
-                SUM(CASE WHEN started_at IS NULL THEN 1 ELSE 0 END) as invalid_timestamp,
-                SUM(CASE WHEN start_station_id IS NULL OR start_station_id = '' THEN 1 ELSE 0 END) as missing_start_station,
-                SUM(CASE WHEN end_station_id IS NULL OR end_station_id = '' THEN 1 ELSE 0 END) as missing_end_station,
-                SUM(CASE WHEN duration_sec < 0 THEN 1 ELSE 0 END) as negative_duration,
-                SUM(CASE WHEN duration_sec >= 0 AND duration_sec < 90 THEN 1 ELSE 0 END) as duration_under_90s,
-                SUM(CASE WHEN duration_sec > 14400 THEN 1 ELSE 0 END) as duration_over_4h,
-                SUM(CASE WHEN start_lat IS NULL OR start_lng IS NULL THEN 1 ELSE 0 END) as missing_start_coords,
-                SUM(CASE WHEN end_lat IS NULL OR end_lng IS NULL THEN 1 ELSE 0 END) as missing_end_coords,
-                SUM(CASE WHEN start_lat NOT BETWEEN 40.4 AND 41.0 OR start_lng NOT BETWEEN -74.3 AND -73.7 THEN 1 ELSE 0 END) as invalid_start_coords,
-                SUM(CASE WHEN end_lat NOT BETWEEN 40.4 AND 41.0 OR end_lng NOT BETWEEN -74.3 AND -73.7 THEN 1 ELSE 0 END) as invalid_end_coords
-            FROM raw
+        columns = LEGACY_TITLECASE_COLUMNS if is_titlecase else LEGACY_COLUMNS
+        select_clause = f"""
+                TRY_CAST({time_col} AS TIMESTAMP) as started_at,
+                TRY_CAST({time_col} AS TIMESTAMP) IS NOT NULL as has_timestamps,
+                {duration_col}::INTEGER as duration_sec,
+                CAST({start_id_col} AS VARCHAR) as start_station_id,
+                CAST({end_id_col} AS VARCHAR) as end_station_id,
+                TRY_CAST({start_lat_col} AS DOUBLE) as start_lat,
+                TRY_CAST({start_lng_col} AS DOUBLE) as start_lng,
+                TRY_CAST({end_lat_col} AS DOUBLE) as end_lat,
+                TRY_CAST({end_lng_col} AS DOUBLE) as end_lng
         """
 
+    # Files whose header doesn't match the known layout fall back to sniffing
+    if header != list(columns):
+        columns = None
+
+    con.execute(f"""
+        CREATE OR REPLACE TEMP TABLE trips AS
+        SELECT {select_clause}
+        FROM {read_csv_sql(csv_pattern, columns)}
+    """)
+    return True
+
+
+def analyze_filtered_rows(con: duckdb.DuckDBPyConnection, table: str = 'trips') -> dict:
+    """
+    Analyze why rows would be filtered out.
+    Returns detailed breakdown.
+    """
+    query = f"""
+        SELECT
+            COUNT(*) as total_rows,
+            SUM(CASE WHEN NOT has_timestamps THEN 1 ELSE 0 END) as invalid_timestamp,
+            SUM(CASE WHEN start_station_id IS NULL OR start_station_id = '' THEN 1 ELSE 0 END) as missing_start_station,
+            SUM(CASE WHEN end_station_id IS NULL OR end_station_id = '' THEN 1 ELSE 0 END) as missing_end_station,
+            SUM(CASE WHEN duration_sec < 0 THEN 1 ELSE 0 END) as negative_duration,
+            SUM(CASE WHEN duration_sec >= 0 AND duration_sec < 90 THEN 1 ELSE 0 END) as duration_under_90s,
+            SUM(CASE WHEN duration_sec > 14400 THEN 1 ELSE 0 END) as duration_over_4h,
+            SUM(CASE WHEN start_lat IS NULL OR start_lng IS NULL THEN 1 ELSE 0 END) as missing_start_coords,
+            SUM(CASE WHEN end_lat IS NULL OR end_lng IS NULL THEN 1 ELSE 0 END) as missing_end_coords,
+            SUM(CASE WHEN start_lat NOT BETWEEN 40.4 AND 41.0 OR start_lng NOT BETWEEN -74.3 AND -73.7 THEN 1 ELSE 0 END) as invalid_start_coords,
+            SUM(CASE WHEN end_lat NOT BETWEEN 40.4 AND 41.0 OR end_lng NOT BETWEEN -74.3 AND -73.7 THEN 1 ELSE 0 END) as invalid_end_coords
+        FROM {table}
+    """
+
     result = con.execute(query).fetchone()
     cols = ['total_rows', 'invalid_timestamp', 'missing_start_station', 'missing_end_station',
             'negative_duration', 'duration_under_90s', 'duration_over_4h',
@@ -118,27 +171,20 @@ def track_station_appearances(con: duckdb.DuckDBPyConnection, csv_dir: Path) ->
     """
     # Get all unique station IDs with their first and last appearance
     query = f"""
-        WITH all_stations AS (
-            -- Modern schema files
+        WITH trips AS (
+            -- Modern schema files, scanned once
             SELECT
-                COALESCE(CAST(start_station_id AS VARCHAR), '') as station_id,
-                start_station_name as station_name,
-                start_lat as lat,
-                start_lng as lng,
+                start_station_id, start_station_name, start_lat, start_lng,
+                end_station_id, end_station_name, end_lat, end_lng,
                 DATE_TRUNC('month', started_at::TIMESTAMP) as month
-            FROM read_csv_auto('{csv_dir}/*202*.csv', ignore_errors=true)
-            WHERE start_station_id IS NOT NULL AND CAST(start_station_id AS VARCHAR) != ''
-
-            UNION ALL
-
-            SELECT
-                COALESCE(CAST(end_station_id AS VARCHAR), '') as station_id,
-                end_station_name as station_name,
-                end_lat as lat,
-                end_lng as lng,
-                DATE_TRUNC('month', started_at::TIMESTAMP) as month
-            FROM read_csv_auto('{csv_dir}/*202*.csv', ignore_errors=true)
-            WHERE end_station_id IS NOT NULL AND CAST(end_station_id AS VARCHAR) != ''
+            FROM {read_csv_sql(f'{csv_dir}/*202*.csv', MODERN_COLUMNS)}
+        ),
+        all_stations AS (
+            -- One row per trip endpoint (start and end)
+            UNPIVOT trips
+            ON (start_station_id, start_station_name, start_lat, start_lng) AS start_station,
+               (end_station_id, end_station_name, end_lat, end_lng) AS end_station
+            INTO NAME endpoint VALUE station_id, station_name, lat, lng
         )
         SELECT
             station_id,
@@ -149,7 +195,7 @@ def track_station_appearances(con: duckdb.DuckDBPyConnection, csv_dir: Path) ->
             MAX(month) as last_seen,
             COUNT(DISTINCT month) as months_active
         FROM all_stations
-        WHERE station_id != ''
+        WHERE station_id IS NOT NULL AND station_id != ''
         GROUP BY station_id
         ORDER BY first_seen
     """
@@ -175,7 +221,7 @@ def track_station_appearances(con: duckdb.DuckDBPyConnection, csv_dir: Path) ->
         return {'error': str(e)}
 
 
-def analyze_coordinate_quality(con: duckdb.DuckDBPyConnection, csv_pattern: str) -> dict:
+def analyze_coordinate_quality(con: duckdb.DuckDBPyConnection, table: str = 'trips') -> dict:
     """
     Analyze coordinate data quality and variations.
     """
@@ -183,24 +229,39 @@ def analyze_coordinate_quality(con: duckdb.DuckDBPyConnection, csv_pattern: str)
     query = f"""
         WITH station_coords AS (
             SELECT
-                CAST(start_station_id AS VARCHAR) as station_id,
+                start_station_id as station_id,
                 start_lat as lat,
                 start_lng as lng
-            FROM read_csv_auto('{csv_pattern}', ignore_errors=true)
+            FROM {table}
             WHERE start_station_id IS NOT NULL
+        ),
+        varied AS (
+            -- Cheap per-station MIN/MAX pass; more than one distinct rounded
+            -- value <=> rounded min != rounded max (ROUND is monotonic)
+            SELECT
+                station_id,
+                MIN(lat) as min_lat, MAX(lat) as max_lat,
+                MIN(lng) as min_lng, MAX(lng) as max_lng,
+                COUNT(*) as trips
+            FROM station_coords
+            GROUP BY station_id
+            HAVING ROUND(MIN(lat), 4) != ROUND(MAX(lat), 4)
+                OR ROUND(MIN(lng), 4) != ROUND(MAX(lng), 4)
+            ORDER BY (max_lat - min_lat) + (max_lng - min_lng) DESC
+            LIMIT 20
         )
+        -- Exact distinct counts only for the reported stations
         SELECT
-            station_id,
-            COUNT(DISTINCT ROUND(lat, 4)) as unique_lats,
-            COUNT(DISTINCT ROUND(lng, 4)) as unique_lngs,
-            MIN(lat) as min_lat, MAX(lat) as max_lat,
-            MIN(lng) as min_lng, MAX(lng) as max_lng,
-            COUNT(*) as trips
-        FROM station_coords
-        GROUP BY station_id
-        HAVING COUNT(DISTINCT ROUND(lat, 4)) > 1 OR COUNT(DISTINCT ROUND(lng, 4)) > 1
-        ORDER BY (MAX(lat) - MIN(lat)) + (MAX(lng) - MIN(lng)) DESC
-        LIMIT 20
+            v.station_id,
+            COUNT(DISTINCT ROUND(c.lat, 4)) as unique_lats,
+            COUNT(DISTINCT ROUND(c.lng, 4)) as unique_lngs,
+            v.min_lat, v.max_lat,
+            v.min_lng, v.max_lng,
+            v.trips
+        FROM varied v
+        JOIN station_coords c ON c.station_id = v.station_id
+        GROUP BY v.station_id, v.min_lat, v.max_lat, v.min_lng, v.max_lng, v.trips
+        ORDER BY (v.max_lat - v.min_lat) + (v.max_lng - v.min_lng) DESC
     """
 
     try:
@@ -223,44 +284,85 @@ def analyze_coordinate_quality(con: duckdb.DuckDBPyConnection, csv_pattern: str)
         return {'error': str(e)}
 
 
-def identify_anomalies(con: duckdb.DuckDBPyConnection, csv_pattern: str) -> dict:
+def identify_anomalies(con: duckdb.DuckDBPyConnection, table: str = 'trips') -> dict:
     """
     Identify various data anomalies.
     """
-    anomalies = {}
-
-    # Check for future dates
-    try:
-        result = con.execute(f"""
-            SELECT COUNT(*) FROM read_csv_auto('{csv_pattern}', ignore_errors=true)
-            WHERE TRY_CAST(started_at AS TIMESTAMP) > CURRENT_TIMESTAMP
-        """).fetchone()[0]
-        anomalies['future_dates'] = result
-    except:
-        anomalies['future_dates'] = 'N/A'
-
-    # Check for very old dates (before Citi Bike launch in 2013)
+    # Future dates, very old dates (before Citi Bike launch in 2013), and
+    # same start/end station (round trips), counted in one pass
     try:
-        result = con.execute(f"""
-            SELECT COUNT(*) FROM read_csv_auto('{csv_pattern}', ignore_errors=true)
-            WHERE TRY_CAST(started_at AS TIMESTAMP) < '2013-01-01'
-        """).fetchone()[0]
-        anomalies['pre_launch_dates'] = result
-    except:
-        anomalies['pre_launch_dates'] = 'N/A'
-
-    # Check for same start/end station (round trips)
+        future_dates, pre_launch_dates, round_trips = con.execute(f"""
+            SELECT
+                SUM(CASE WHEN started_at > CURRENT_TIMESTAMP THEN 1 ELSE 0 END),
+                SUM(CASE WHEN started_at < '2013-01-01' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN start_station_id = end_station_id AND start_station_id IS NOT NULL THEN 1 ELSE 0 END)
+            FROM {table}
+        """).fetchone()
+    except duckdb.Error:
+        future_dates = pre_launch_dates = round_trips = 'N/A'
+
+    return {
+        'future_dates': future_dates,
+        'pre_launch_dates': pre_launch_dates,
+        'round_trips': round_trips,
+    }
+
+
+def audit_year(con: duckdb.DuckDBPyConnection, year: int) -> dict:
+    """
+    Run all analyses for one year on its own cursor of `con`. The `trips`
+    temp table is private to the cursor, so years can run concurrently.
+    """
+    cur = con.cursor()
     try:
-        result = con.execute(f"""
-            SELECT COUNT(*) FROM read_csv_auto('{csv_pattern}', ignore_errors=true)
-            WHERE CAST(start_station_id AS VARCHAR) = CAST(end_station_id AS VARCHAR)
-              AND start_station_id IS NOT NULL
-        """).fetchone()[0]
-        anomalies['round_trips'] = result
-    except:
-        anomalies['round_trips'] = 'N/A'
+        csv_pattern = str(DATA_DIR / "raw_csvs" / f"*{year}*.csv")
+        if not load_trips(cur, csv_pattern):
+            return {'error': 'No files found'}
+
+        return {
+            'filter_stats': analyze_filtered_rows(cur),
+            'coord_quality': analyze_coordinate_quality(cur),
+            'anomalies': identify_anomalies(cur),
+        }
+    finally:
+        cur.close()
+
+
+def print_year_report(year: int, results: dict):
+    """Print the audit summary for one year."""
+    print(f"\n{'='*50}")
+    print(f"Auditing {year}")
+    print('='*50)
+
+    if 'error' in results:
+        print("  No files found")
+        return
 
-    return anomalies
+    # Filter analysis
+    print("\nFiltered rows analysis:")
+    filter_stats = results['filter_stats']
+    if 'error' not in filter_stats:
+        total = filter_stats['total_rows']
+        print(f"  Total rows: {total:,}")
+        for key, value in filter_stats.items():
+            if key != 'total_rows' and value > 0:
+                pct = 100 * value / total if total > 0 else 0
+                print(f"  {key}: {value:,} ({pct:.2f}%)")
+
+    # Coordinate quality
+    print("\nCoordinate quality:")
+    coord_stats = results['coord_quality']
+    if 'error' not in coord_stats:
+        print(f"  Stations with coordinate variations: {coord_stats['stations_with_coord_variations']}")
+        if coord_stats['examples']:
+            print("  Top variations:")
+            for ex in coord_stats['examples'][:5]:
+                print(f"    Station {ex['station_id']}: lat {ex['lat_range']}, lng {ex['lng_range']}")
+
+    # Anomalies
+    print("\nAnomalies:")
+    for key, value in results['anomalies'].items():
+        print(f"  {key}: {value:,}" if isinstance(value, int) else f"  {key}: {value}")
 
 
 def main():
@@ -295,47 +397,15 @@ def main():
         print("Please specify --year YYYY or --all")
         return
 
+    # Years read disjoint file sets, so audit them concurrently on cursors of
+    # one database: they share its memory_limit and thread pool instead of
+    # each getting a full budget. Reports are printed in year order as
+    # results come back.
     all_results = {}
-
-    for year in years:
-        print(f"\n{'='*50}")
-        print(f"Auditing {year}")
-        print('='*50)
-
-        csv_pattern = str(DATA_DIR / "raw_csvs" / f"*{year}*.csv")
-
-        # Filter analysis
-        print("\nFiltered rows analysis:")
-        filter_stats = analyze_filtered_rows(con, csv_pattern)
-        if 'error' not in filter_stats:
-            total = filter_stats['total_rows']
-            print(f"  Total rows: {total:,}")
-            for key, value in filter_stats.items():
-                if key != 'total_rows' and value > 0:
-                    pct = 100 * value / total if total > 0 else 0
-                    print(f"  {key}: {value:,} ({pct:.2f}%)")
-
-        # Coordinate quality
-        print("\nCoordinate quality:")
-        coord_stats = analyze_coordinate_quality(con, csv_pattern)
-        if 'error' not in coord_stats:
-            print(f"  Stations with coordinate variations: {coord_stats['stations_with_coord_variations']}")
-            if coord_stats['examples']:
-                print("  Top variations:")
-                for ex in coord_stats['examples'][:5]:
-                    print(f"    Station {ex['station_id']}: lat {ex['lat_range']}, lng {ex['lng_range']}")
-
-        # Anomalies
-        print("\nAnomalies:")
-        anomalies = identify_anomalies(con, csv_pattern)
-        for key, value in anomalies.items():
-            print(f"  {key}: {value:,}" if isinstance(value, int) else f"  {key}: {value}")
-
-        all_results[year] = {
-            'filter_stats': filter_stats,
-            'coord_quality': coord_stats,
-            'anomalies': anomalies,
-        }
+    with ThreadPoolExecutor(max_workers=min(AUDIT_WORKERS, len(years))) as ex:
+        for year, results in zip(years, ex.map(lambda y: audit_year(con, y), years)):
+            print_year_report(year, results)
+            all_results[year] = results
 
     # Save audit results
     log_path = LOGS_DIR / f"audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
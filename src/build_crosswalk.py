@@ -26,8 +26,10 @@ IMPORTANT: Review the output! Some matches will need manual correction.
 
 import argparse
 import csv
+import hashlib
 import json
-import math
+import os
+from operator import itemgetter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -35,34 +37,47 @@ from typing import Optional
 try:
     import duckdb
     from rapidfuzz import fuzz
-    from scipy.spatial import cKDTree
+    from rapidfuzz.process import cpdist
+    from sklearn.neighbors import BallTree
     import numpy as np
 except ImportError as e:
     print(f"Missing dependency: {e}")
-    print("Run: pip install duckdb rapidfuzz scipy numpy")
+    print("Run: pip install duckdb rapidfuzz scikit-learn numpy")
     exit(1)
 
 REFERENCE_DIR = Path(__file__).parent.parent / "reference"
 DATA_DIR = Path(__file__).parent.parent / "data"
 LOGS_DIR = Path(__file__).parent.parent / "logs"
 
+EARTH_RADIUS_M = 6371000
 
-def haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two points in meters."""
-    R = 6371000  # Earth radius in meters
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    
-    a = math.sin(dphi/2)**2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda/2)**2
-    return 2 * R * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+# Fixed types for the name/coordinate columns read by extract_legacy_stations,
+# in both the legacy and modern spellings (a file lacking one is fine with
+# union_by_name). Station ID columns are left to type inference: the inferred
+# type decides the legacy_id text (e.g. 519 vs 519.0) the pipeline joins on.
+LEGACY_SCAN_TYPES = {
+    'start station name': 'VARCHAR', 'start station latitude': 'DOUBLE', 'start station longitude': 'DOUBLE',
+    'start_station_name': 'VARCHAR', 'start_lat': 'DOUBLE', 'start_lng': 'DOUBLE',
+}
+
+
+def legacy_cache_key(csv_dir: Path, query: str) -> str:
+    """Hash of the extraction query and the CSV file list (names + mtimes)."""
+    files = sorted((p.name, p.stat().st_mtime_ns) for p in csv_dir.glob('*.csv'))
+    return hashlib.sha256(json.dumps([query, files]).encode()).hexdigest()
 
 
-def extract_legacy_stations(csv_dir: Path, system: str = 'nyc') -> list[dict]:
+def extract_legacy_stations(csv_dir: Path, system: str = 'nyc') -> dict:
     """
     Extract unique legacy stations from raw CSVs using DuckDB.
     Uses MEDIAN for coordinates to filter GPS noise.
 
+    Returns parallel columns: legacy_id, legacy_name and trip_count as lists,
+    legacy_lat and legacy_lon as float64 arrays.
+
+    The result is cached to legacy_stations_<system>.parquet next to csv_dir
+    and reused until the CSVs (or the query) change.
+
     Args:
         csv_dir: Directory containing CSV files
         system: 'nyc' or 'jc' - determines coordinate bounds and ID filtering
@@ -115,13 +130,15 @@ def extract_legacy_stations(csv_dir: Path, system: str = 'nyc') -> list[dict]:
                 "start station longitude",
                 start_lng
             ) as lon
-        FROM read_csv_auto('{csv_dir}/*.csv', union_by_name=True, ignore_errors=true)
+        FROM read_csv_auto('{csv_dir}/*.csv', union_by_name=True, ignore_errors=true,
+                           types={LEGACY_SCAN_TYPES})
         WHERE station_id IS NOT NULL
     ),
     cleaned AS (
         SELECT
-            -- Remove .0 suffix from float conversion
-            REGEXP_REPLACE(CAST(station_id AS VARCHAR), '\\.0$', '') as station_id,
+            -- Remove .0 suffix from float conversion (plain suffix test, no regex;
+            -- must happen before GROUP BY so 519 and 519.0 group together)
+            CASE WHEN suffix(station_id, '.0') THEN station_id[:-3] ELSE station_id END as station_id,
             station_name,
             CAST(lat AS DOUBLE) as lat,
             CAST(lon AS DOUBLE) as lon
@@ -143,44 +160,115 @@ def extract_legacy_stations(csv_dir: Path, system: str = 'nyc') -> list[dict]:
     ORDER BY trip_count DESC
     """
 
+    cache_path = csv_dir.parent / f"legacy_stations_{system}.parquet"
+    key_path = cache_path.with_suffix('.key')
+    key = legacy_cache_key(csv_dir, query)
+
     try:
-        result = con.execute(query).fetchall()
-        columns = ['legacy_id', 'legacy_name', 'legacy_lat', 'legacy_lon', 'trip_count']
-        stations = [dict(zip(columns, row)) for row in result]
-        print(f"Found {len(stations)} unique legacy stations")
+        if cache_path.exists() and key_path.exists() and key_path.read_text() == key:
+            print(f"Using cached legacy stations from {cache_path.name}")
+        else:
+            key_path.unlink(missing_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            con.execute(f"COPY ({query}) TO '{tmp_path}' (FORMAT PARQUET)")
+            os.replace(tmp_path, cache_path)
+            key_path.write_text(key)
+
+        result = con.execute(f"SELECT * FROM read_parquet('{cache_path}')").fetchnumpy()
+        stations = {
+            'legacy_id': result['legacy_id'].tolist(),
+            'legacy_name': result['legacy_name'].tolist(),
+            'legacy_lat': np.asarray(result['legacy_lat'], dtype=np.float64),
+            'legacy_lon': np.asarray(result['legacy_lon'], dtype=np.float64),
+            'trip_count': result['trip_count'].tolist(),
+        }
+        print(f"Found {len(stations['legacy_id'])} unique legacy stations")
         return stations
     except Exception as e:
         print(f"Error querying CSVs: {e}")
         raise
 
 
-def load_modern_stations(csv_path: Path) -> list[dict]:
-    """Load current stations from the GBFS export."""
-    stations = []
+def load_modern_stations(csv_path: Path) -> dict:
+    """
+    Load current stations from the GBFS export.
+
+    Returns parallel columns: station_id and name as lists, lat and lon as
+    float64 arrays.
+    """
     with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            stations.append({
-                'station_id': row['station_id'],
-                'name': row['name'],
-                'lat': float(row['lat']),
-                'lon': float(row['lon']),
-            })
-    print(f"Loaded {len(stations)} modern stations from {csv_path.name}")
+        rows = list(csv.DictReader(f))
+    stations = {
+        'station_id': [row['station_id'] for row in rows],
+        'name': [row['name'] for row in rows],
+        'lat': np.array([float(row['lat']) for row in rows], dtype=np.float64),
+        'lon': np.array([float(row['lon']) for row in rows], dtype=np.float64),
+    }
+    print(f"Loaded {len(rows)} modern stations from {csv_path.name}")
     return stations
 
 
-def build_spatial_index(stations: list[dict]) -> tuple:
-    """Build a KDTree for fast spatial lookups."""
-    coords = np.array([[s['lat'], s['lon']] for s in stations])
-    tree = cKDTree(coords)
-    return tree, coords
+def build_spatial_index(stations: dict) -> BallTree:
+    """Build a BallTree on (lat, lon) radians so queries use great-circle distance."""
+    coords = np.radians(np.column_stack([stations['lat'], stations['lon']]))
+    return BallTree(coords, metric='haversine')
+
+
+def find_candidates(
+    legacy_stations: dict,
+    tree: BallTree,
+    max_distance_m: float = 150
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find every modern station within max_distance_m of each legacy station.
+
+    Returns (indices, distances_m): per legacy station, arrays of modern
+    station indices and their haversine distances in meters, nearest first.
+    """
+    if not legacy_stations['legacy_id']:  # BallTree rejects an empty query
+        return np.empty(0, dtype=object), np.empty(0, dtype=object)
+
+    legacy_coords = np.radians(
+        np.column_stack([legacy_stations['legacy_lat'], legacy_stations['legacy_lon']])
+    )
+    indices, distances = tree.query_radius(
+        legacy_coords, r=max_distance_m / EARTH_RADIUS_M,
+        return_distance=True, sort_results=True
+    )
+    return indices, distances * EARTH_RADIUS_M
+
+
+def score_candidate_names(
+    legacy_stations: dict,
+    modern_stations: dict,
+    candidate_indices: np.ndarray
+) -> list[np.ndarray]:
+    """
+    Score name similarity for every (legacy, candidate) pair in one batch.
+
+    Returns one array of token_sort_ratio scores per legacy station, aligned
+    with its candidate_indices.
+    """
+    counts = [len(indices) for indices in candidate_indices]
+    modern_names = [name.lower() for name in modern_stations['name']]
+    legacy_names = [
+        name.lower()
+        for name, count in zip(legacy_stations['legacy_name'], counts) for _ in range(count)
+    ]
+    candidate_names = [
+        modern_names[idx]
+        for indices in candidate_indices for idx in indices
+    ]
+    scores = cpdist(legacy_names, candidate_names, scorer=fuzz.token_sort_ratio,
+                    dtype=np.float64, workers=-1)
+    return np.split(scores, np.cumsum(counts)[:-1])
 
 
 def match_station(
-    legacy: dict,
-    modern_stations: list[dict],
-    tree: cKDTree,
+    modern_stations: dict,
+    candidate_indices: np.ndarray,
+    candidate_distances: np.ndarray,
+    candidate_name_scores: np.ndarray,
     max_distance_m: float = 150,
     min_name_score: float = 60
 ) -> Optional[dict]:
@@ -188,43 +276,17 @@ def match_station(
     Find the best matching modern station for a legacy station.
     
     Uses a "double lock" approach:
-    1. Find candidates within max_distance_m
-    2. Score by name similarity
+    1. Find candidates within max_distance_m (precomputed by find_candidates)
+    2. Score by name similarity (precomputed by score_candidate_names)
     3. Return best match if it exceeds thresholds
     """
-    # Query the KDTree for nearby stations
-    # Convert meters to approximate degrees (at NYC latitude)
-    # 1 degree latitude ≈ 111km, 1 degree longitude ≈ 85km at 40.7°N
-    degree_radius = max_distance_m / 85000  # Conservative (uses smaller dimension)
-    
-    legacy_coords = [legacy['legacy_lat'], legacy['legacy_lon']]
-    distances, indices = tree.query(legacy_coords, k=5, distance_upper_bound=degree_radius)
-    
     best_match = None
     best_score = 0
     best_distance = float('inf')
     
-    for dist_deg, idx in zip(distances, indices):
-        if idx >= len(modern_stations):  # KDTree padding
-            continue
-        
-        candidate = modern_stations[idx]
-        
-        # Calculate actual distance in meters
-        distance_m = haversine_meters(
-            legacy['legacy_lat'], legacy['legacy_lon'],
-            candidate['lat'], candidate['lon']
-        )
-        
-        if distance_m > max_distance_m:
-            continue
-        
-        # Calculate name similarity
-        name_score = fuzz.token_sort_ratio(
-            legacy['legacy_name'].lower(),
-            candidate['name'].lower()
-        )
-        
+    for idx, distance_m, name_score in zip(
+        candidate_indices.tolist(), candidate_distances.tolist(), candidate_name_scores.tolist()
+    ):
         # Combined score: weight name more heavily, but penalize distance
         # Score range: 0-100
         proximity_score = 100 * (1 - distance_m / max_distance_m)
@@ -234,8 +296,8 @@ def match_station(
             best_score = combined_score
             best_distance = distance_m
             best_match = {
-                'modern_id': candidate['station_id'],
-                'modern_name': candidate['name'],
+                'modern_id': modern_stations['station_id'][idx],
+                'modern_name': modern_stations['name'][idx],
                 'match_score': round(combined_score, 1),
                 'name_score': name_score,
                 'distance_m': round(distance_m, 1),
@@ -279,29 +341,44 @@ def match_station(
 
 
 def build_crosswalk(
-    legacy_stations: list[dict],
-    modern_stations: list[dict]
+    legacy_stations: dict,
+    modern_stations: dict
 ) -> tuple[list[dict], list[dict]]:
     """Build the crosswalk by matching each legacy station to modern."""
     print("\nBuilding crosswalk...")
     
-    tree, coords = build_spatial_index(modern_stations)
+    tree = build_spatial_index(modern_stations)
+    candidate_indices, candidate_distances = find_candidates(legacy_stations, tree)
+    candidate_name_scores = score_candidate_names(legacy_stations, modern_stations, candidate_indices)
     
     crosswalk = []
     ghosts = []
+
+    legacy_rows = zip(
+        legacy_stations['legacy_id'], legacy_stations['legacy_name'],
+        legacy_stations['legacy_lat'].tolist(), legacy_stations['legacy_lon'].tolist(),
+        legacy_stations['trip_count'],
+    )
+    n_legacy = len(legacy_stations['legacy_id'])
     
-    for i, legacy in enumerate(legacy_stations):
+    for i, (legacy_id, legacy_name, legacy_lat, legacy_lon, trip_count) in enumerate(legacy_rows):
         if (i + 1) % 100 == 0:
-            print(f"  Processed {i + 1}/{len(legacy_stations)} stations...")
+            print(f"  Processed {i + 1}/{n_legacy} stations...")
         
-        match = match_station(legacy, modern_stations, tree)
+        match = match_station(
+            modern_stations,
+            candidate_indices[i], candidate_distances[i], candidate_name_scores[i]
+        )
         
+        legacy = {
+            'legacy_id': legacy_id,
+            'legacy_name': legacy_name,
+            'legacy_lat': legacy_lat,
+            'legacy_lon': legacy_lon,
+            'trip_count': trip_count,
+        }
         row = {
-            'legacy_id': legacy['legacy_id'],
-            'legacy_name': legacy['legacy_name'],
-            'legacy_lat': legacy['legacy_lat'],
-            'legacy_lon': legacy['legacy_lon'],
-            'trip_count': legacy['trip_count'],
+            **legacy,
             'modern_id': match['modern_id'] if match else '',
             'modern_name': match['modern_name'] if match else '',
             'match_score': match['match_score'] if match else 0,
@@ -333,9 +410,9 @@ def save_outputs(crosswalk: list[dict], ghosts: list[dict], system: str = 'nyc')
     ]
     
     with open(csv_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(crosswalk)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(map(itemgetter(*fieldnames), crosswalk))
     
     print(f"\n✓ Saved crosswalk to {csv_path}")
     
@@ -343,8 +420,7 @@ def save_outputs(crosswalk: list[dict], ghosts: list[dict], system: str = 'nyc')
     overrides_path = REFERENCE_DIR / "manual_overrides.csv"
     if not overrides_path.exists():
         with open(overrides_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            csv.writer(f).writerow(fieldnames)
         print(f"✓ Created empty {overrides_path.name}")
     
     # Calculate stats
@@ -59,15 +59,14 @@ def build_test_station_sql_filter() -> str:
     return " AND ".join(conditions)
 
 
-def haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two points in meters."""
-    import math
+def haversine_meters(lat1, lon1, lat2, lon2):
+    """Calculate distance in meters between points (floats or NumPy arrays)."""
     R = 6371000
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    a = math.sin(dphi/2)**2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda/2)**2
-    return 2 * R * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    dphi = np.radians(np.subtract(lat2, lat1))
+    dlambda = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(dphi/2)**2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda/2)**2
+    return 2 * R * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
 
 def extract_year_from_filename(filename: str) -> int:
@@ -188,18 +187,23 @@ def load_current_stations(csv_path: Path) -> dict:
 
 def find_nearest_station(lat: float, lon: float, current_stations: dict, n: int = 3) -> list[dict]:
     """Find the n nearest stations to given coordinates."""
-    distances = []
-    for sid, station in current_stations.items():
-        dist = haversine_meters(lat, lon, float(station['lat']), float(station['lon']))
-        distances.append({
-            'station_id': sid,
+    station_ids = list(current_stations)
+    lats = np.array([float(s['lat']) for s in current_stations.values()])
+    lons = np.array([float(s['lon']) for s in current_stations.values()])
+    # One vectorized pass over all stations instead of a haversine call per station
+    dists = haversine_meters(lat, lon, lats, lons)
+
+    nearest = []
+    for i in np.argsort(np.round(dists, 1), kind='stable')[:n]:
+        station = current_stations[station_ids[i]]
+        nearest.append({
+            'station_id': station_ids[i],
             'name': station['name'],
-            'lat': float(station['lat']),
-            'lon': float(station['lon']),
-            'distance_m': round(dist, 1)
+            'lat': float(lats[i]),
+            'lon': float(lons[i]),
+            'distance_m': round(float(dists[i]), 1)
         })
-    distances.sort(key=lambda x: x['distance_m'])
-    return distances[:n]
+    return nearest
 
 
 def classify_match(obs: dict, crosswalk_entry: dict, canonical: dict) -> dict: